@@ -10,6 +10,11 @@ Formats supportés :
 - bin
 - url
 - rot
+- gzip, zlib, bz2, xz, zip (décompressés en flux, plafonnés) et fichiers
+  reconnus par magic number (png, jpeg, gif, pdf, elf), voir magic_layers.py
+- xor (clé d'un octet ou clé courte répétée, sur l'entrée brute ou décodée)
+- tout format du registre de encode_decode qui fournit un validateur
+  (base58, base85, ascii85, uu, qp via extra_codecs.py)
 
 Résultat : une liste de candidats avec :
 - format source
@@ -21,11 +26,38 @@ Utilisation comme module :
     from auto_detect_encoding import detect_encodings
     best = detect_encodings("ZmxhZ3t0ZXN0fQ==")[0].decoded_text
 
+Entrée binaire (bytes) : magic numbers, décompression, XOR :
+    best = detect_encodings(open("blob.bin", "rb").read())[0]
+
+Décodage multi-couches (ex: base64 de hex de ROT13) :
+    from auto_detect_encoding import decode_layers
+    chain = decode_layers(data, max_depth=4)
+    print(chain.formats, chain.decoded_text)
+
+Détection en lot (pool de processus, résultats dans l'ordre d'entrée) :
+    from auto_detect_encoding import detect_many
+    for cands in detect_many(lines, workers=8):
+        ...
+
+Ligne de commande (fichiers ligne à ligne ou NDJSON, sortie NDJSON) :
+    python -m encodage.auto_detect_encoding captures.txt
+    python -m encodage.auto_detect_encoding --ndjson --field data captures.ndjson
+
 """
+import hashlib
+import os
 import string
-from dataclasses import dataclass
-from typing import List, Optional
-from encodage.encode_decode import convert_str
+import sys
+import time
+from collections import deque
+from dataclasses import asdict, astuple, dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from encodage.encode_decode import convert_str, iter_codecs, to_bytes
+from encodage.magic_layers import COMPRESSED_FORMATS, decompress, sniff
+from encodage.ngram_score import english_likeness
+from encodage.xor_detect import repeating_key_xor, single_byte_xor, xor_bytes
 
 @dataclass
 class Candidate:
@@ -34,33 +66,63 @@ class Candidate:
     score: float             # score heuristique
     extra_info: Optional[str] = None  # ex: "ROT=13"
 
+@dataclass
+class DecodeChain:
+    layers: List[Candidate] = field(default_factory=list)  # une entrée par couche retirée
+    decoded_text: str = ""   # texte final après toutes les couches
+    score: float = 0.0       # score du texte final
+
+    @property
+    def formats(self) -> List[str]:
+        """Formats des couches, de la plus externe à la plus interne"""
+        return [
+            f"{c.source_fmt}({c.extra_info})" if c.extra_info else c.source_fmt
+            for c in self.layers
+        ]
+
+# Alphabets des validateurs : on supprime d'un coup (bytes.translate) tous les
+# caractères autorisés, la chaîne est valide s'il ne reste rien.
+_HEX_CHARS = b"0123456789abcdefABCDEF"
+_B64_CHARS = (string.ascii_letters + string.digits + "+/=").encode("ascii")
+_B32_CHARS = (string.ascii_letters + "234567").encode("ascii")
+_BIN_CHARS = b"01"
+_WHITESPACE_CHARS = string.whitespace.encode("ascii")
+
+
+def _only(s, allowed):
+    """Vrai si tous les caractères de s appartiennent à `allowed`"""
+    return s.isascii() and not s.encode("ascii").translate(None, allowed)
+
+
+def _strip_ws(s):
+    if s.isascii():
+        return s.encode("ascii").translate(None, _WHITESPACE_CHARS).decode("ascii")
+    return "".join(s.split())
+
+
 def hex(s: str) -> bool:
-    s_clean = "".join(s.split())
+    s_clean = _strip_ws(s)
     if len(s_clean) < 2 or len(s_clean) % 2 != 0:
         return False
-    allowed = set("0123456789abcdefABCDEF")
-    return all(c in allowed for c in s_clean)
+    return _only(s_clean, _HEX_CHARS)
 
 def b64(s):
     s_clean = s.strip()
     if len(s_clean) < 4 or len(s_clean) % 4 != 0:
         return False
-    allowed = set(string.ascii_letters + string.digits + "+/=")
-    return all(c in allowed for c in s_clean)
+    return _only(s_clean, _B64_CHARS)
 
 def b32(s):
     s_clean = s.strip().replace("=", "")
     if len(s_clean) < 2:
         return False
-    allowed = set(string.ascii_uppercase + "234567")
-    s_upper = s_clean.upper()
-    return all(c in allowed for c in s_upper)
+    return _only(s_clean, _B32_CHARS)
 
 def bin(s):
-    bits = "".join(s.split())
+    bits = _strip_ws(s)
     if not bits:
         return False
-    if any(c not in "01" for c in bits):
+    if not _only(bits, _BIN_CHARS):
         return False
     return len(bits) % 8 == 0
 
@@ -88,43 +150,204 @@ def rot(s):
     letters = sum(c.isalpha() for c in s)
     return letters >= max(3, len(s) // 3)
 
+_PRINTABLE_BYTES = string.printable.encode("ascii")
+_LETTER_BYTES = string.ascii_letters.encode("ascii")
+# Longueur moyenne des "mots" (caractères entre blancs) au-delà de laquelle le
+# texte n'a plus de structure de mots : un bloc base64 ou son ROT contient
+# des fragments anglais que les quadgrammes récompensent à tort.
+MAX_WORD_LENGTH = 12
+
+
 def score(text):
     if not text:
         return 0.0
     length = len(text)
-    printable = sum(c in string.printable for c in text)
-    letters = sum(c.isalpha() for c in text)
+    if text.isascii():
+        raw = text.encode("ascii")
+        printable = length - len(raw.translate(None, _PRINTABLE_BYTES))
+        letters = length - len(raw.translate(None, _LETTER_BYTES))
+    else:
+        printable = sum(c in string.printable for c in text)
+        letters = sum(c.isalpha() for c in text)
     spaces = text.count(" ")
     newlines = text.count("\n")
     weird = text.count("�")
     printable_ratio = printable / length
     letter_ratio = letters / length
     space_ratio = spaces / length
+    # Les lettres ne comptent que si elles ressemblent à de l'anglais
+    # (quadgrammes, voir ngram_score.py) ; neutre sous 4 lettres.
+    english = english_likeness(text)
+    if english is None:
+        english = 0.5
+    word_length = length / (spaces + newlines + text.count("\t") + 1)
+    if word_length > MAX_WORD_LENGTH:
+        english *= MAX_WORD_LENGTH / word_length
     score = 0.0
     score += printable_ratio * 1.0
-    score += letter_ratio * 0.5
+    score += letter_ratio * english
     score += space_ratio * 0.3
     score += newlines * 0.01
     score -= weird * 0.5
-    lowered = text.lower()
     return score
 
 
+# Validateurs des formats de base ; les autres codecs du registre de
+# encode_decode (ex: extra_codecs.py) fournissent le leur.
+VALIDATORS = {"hex": hex, "base64": b64, "base32": b32, "bin": bin, "url": url}
+
+
+def iter_validators():
+    for codec in iter_codecs():
+        check = VALIDATORS.get(codec.name) or codec.validator
+        if check is not None:
+            yield codec.name, check
+
+
 def try_format(source_fmt,data):
+    """(octets décodés, candidat) ou None : les octets servent aux étapes magic / XOR"""
     try:
-        decoded = convert_str(source_fmt, "text", data)
+        raw = to_bytes(source_fmt, data)
     except Exception:
         return None
 
-    s = decoded
+    s = raw.decode("utf-8", errors="replace")
     sc = score(s)
-    return Candidate(source_fmt=source_fmt, decoded_text=s, score=sc)
+    return raw, Candidate(source_fmt=source_fmt, decoded_text=s, score=sc)
+
+def _mostly_printable(raw):
+    return len(raw.translate(None, _PRINTABLE_BYTES)) <= len(raw) // 20
+
+
+# Une couche imprimable est déjà "lisible" au-delà de ce score, et un XOR n'y
+# est retenu que s'il donne un texte au moins aussi anglais : sinon les clés
+# longues fabriquent une "soupe" de lettres fréquentes qui passe devant les
+# vraies couches intermédiaires.
+_XOR_MIN_ENGLISH = 0.65
+
+# Nombre de décalages ROT gardés par entrée : le score par quadgrammes
+# départage bien les 25 décalages, le meilleur suffit.
+ROT_TOP_K = 1
+
+
+def xor_candidates(raw: bytes, source_fmt: str = "text") -> List[Candidate]:
+    """
+    Étape XOR : meilleure clé d'un octet et clés répétées (voir xor_detect.py)
+    appliquées aux octets `raw`. L'étape est ignorée sur l'entrée brute si le
+    texte est déjà lisible, et sur toute couche qui se lit déjà comme de
+    l'anglais : seules les couches illisibles paient la recherche de clé.
+    """
+    printable = _mostly_printable(raw)
+    if len(raw) < 2 or (source_fmt == "text" and printable):
+        return []
+    if printable and (english_likeness(raw.decode("latin-1")) or 0.0) >= _XOR_MIN_ENGLISH:
+        return []
+    fmt = "xor" if source_fmt == "text" else f"{source_fmt}+xor"
+    keys = [bytes([k]) for k, _ in single_byte_xor(raw) if k]
+    if len(raw) >= 8:
+        # Au moins 3 octets par colonne, sinon la clé "apprend" le texte : les
+        # longueurs plus grandes ne sont même pas essayées
+        max_len = min(40, len(raw) // 3)
+        keys += [k for k in repeating_key_xor(raw, max_len=max_len) if len(k) > 1]
+    candidates: List[Candidate] = []
+    for key in keys:
+        decoded = xor_bytes(raw, key).decode("utf-8", errors="replace")
+        if printable and (english_likeness(decoded) or 0.0) < _XOR_MIN_ENGLISH:
+            continue
+        info = f"XOR=0x{key[0]:02x}" if len(key) == 1 else f"XOR key={key.hex()}"
+        candidates.append(Candidate(fmt, decoded, score(decoded), extra_info=info))
+    return candidates
+
+
+def _raw_bytes(data):
+    try:
+        return data.encode("latin-1")
+    except UnicodeEncodeError:
+        return data.encode("utf-8", errors="surrogatepass")
+
+
+# Plafond de décompression pendant la détection (le texte n'est noté que sur
+# ce préfixe) et score d'un fichier binaire reconnu (png, pdf, ...).
+MAGIC_MAX_SIZE = 1 << 20
+MAGIC_SCORE = 1.2
+
+
+def magic_candidates(
+    raw: bytes,
+    source_fmt: str = "text",
+    max_size: int = MAGIC_MAX_SIZE,
+    depth: int = 3,
+) -> List[Candidate]:
+    """
+    Couches binaires reconnues par magic number (voir magic_layers.py).
+    Les formats compressés sont décompressés en flux, au plus `max_size`
+    octets ; une sortie elle-même compressée est redécompressée (`depth`).
+    """
+    kind = sniff(raw)
+    if kind is None:
+        return []
+    fmt = kind if source_fmt == "text" else f"{source_fmt}+{kind}"
+    if kind not in COMPRESSED_FORMATS:
+        text = f"<fichier {kind}, {len(raw)} octets>"
+        return [Candidate(fmt, text, MAGIC_SCORE, extra_info=f"fichier {kind}")]
+    try:
+        # Charge coupée (préfixe de flux) : on garde la sortie partielle
+        out, truncated = decompress(kind, raw, max_size=max_size, partial=True)
+    except Exception:
+        return []
+    if not out:
+        # Préfixe trop court pour la moindre sortie (bz2 travaille par blocs
+        # de 100 à 900 Ko) : le magic number suffit, avec un score neutre que
+        # la sortie réelle remplacera sur un préfixe plus long. zlib n'a qu'un
+        # en-tête de 2 octets, trop faible pour conclure sans sortie.
+        if truncated and kind != "zlib":
+            text = f"<flux {kind} tronqué, {len(raw)} octets>"
+            return [Candidate(fmt, text, MAGIC_SCORE, extra_info="tronqué, sans sortie")]
+        return []
+    if depth > 1 and sniff(out) is not None:
+        nested = magic_candidates(out, fmt, max_size, depth - 1)
+        if nested:
+            return nested
+    text = out.decode("utf-8", errors="replace")
+    info = f"{len(out)} octets" + (", tronqué" if truncated else "")
+    return [Candidate(fmt, text, score(text), extra_info=info)]
+
+
+def detect_bytes(
+    raw,
+    max_results: int = 5,
+    try_rot: bool = True,
+    try_xor: bool = True,
+) -> List[Candidate]:
+    """
+    Mode binaire de detect_encodings : magic numbers et décompression, puis
+    détection texte habituelle si les octets sont de l'UTF-8 valide, sinon
+    candidat brut + étape XOR.
+    """
+    raw = bytes(raw)
+    candidates = magic_candidates(raw)
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = None
+    if text is not None and not candidates:
+        return detect_encodings(text, max_results, try_rot, try_xor)
+    decoded = raw.decode("utf-8", errors="replace")
+    candidates.append(Candidate("bytes(raw)", decoded, score(decoded)))
+    if try_xor:
+        candidates.extend(xor_candidates(raw))
+    candidates.sort(key=lambda c: c.score, reverse=True)
+    return candidates[:max_results]
+
 
 def detect_encodings(
-    data: str,
+    data: Union[str, bytes],
     max_results: int = 5,
     try_rot: bool = True,
+    try_xor: bool = True,
 ) -> List[Candidate]:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return detect_bytes(data, max_results, try_rot, try_xor)
     candidates: List[Candidate] = []
     cand_text = Candidate(
         source_fmt="text(raw)",
@@ -132,26 +355,17 @@ def detect_encodings(
         score=score(data),
     )
     candidates.append(cand_text)
-    if hex(data):
-        c = try_format("hex", data)
-        if c:
-            candidates.append(c)
-    if b64(data):
-        c = try_format("base64", data)
-        if c:
-            candidates.append(c)
-    if b32(data):
-        c = try_format("base32", data)
-        if c:
-            candidates.append(c)
-    if bin(data):
-        c = try_format("bin", data)
-        if c:
-            candidates.append(c)
-    if url(data):
-        c = try_format("url", data)
-        if c:
-            candidates.append(c)
+    if try_xor:
+        candidates.extend(xor_candidates(_raw_bytes(data)))
+    for fmt, check in iter_validators():
+        if check(data):
+            decoded = try_format(fmt, data)
+            if decoded:
+                raw, c = decoded
+                candidates.append(c)
+                candidates.extend(magic_candidates(raw, fmt))
+                if try_xor:
+                    candidates.extend(xor_candidates(raw, fmt))
     if try_rot and rot(data):
         best_rot_candidates: List[Candidate] = []
         for shift in range(1, 26):
@@ -169,19 +383,265 @@ def detect_encodings(
                 )
             )
         best_rot_candidates.sort(key=lambda c: c.score, reverse=True)
-        candidates.extend(best_rot_candidates[:3])
+        candidates.extend(best_rot_candidates[:ROT_TOP_K])
     candidates.sort(key=lambda c: c.score, reverse=True)
     return candidates[:max_results]
 
+def _content_key(text):
+    return hashlib.sha1(text.encode("utf-8", errors="surrogatepass")).digest()
+
+
+# Candidats gardés par couche dans decode_layers (avant le tri du faisceau)
+LAYER_MAX_CANDIDATES = 32
+
+
+def _expand(text, try_rot, cache, max_candidates=LAYER_MAX_CANDIDATES):
+    """Candidats d'une couche pour `text`, mémoïsés par hash du contenu"""
+    key = (_content_key(text), try_rot, max_candidates)
+    cached = cache.get(key)
+    if cached is None:
+        cached = [
+            c
+            for c in detect_encodings(text, max_results=max_candidates, try_rot=try_rot)
+            if c.source_fmt != "text(raw)" and c.decoded_text != text
+        ]
+        cache[key] = cached
+    return cached
+
+
+def decode_layers(
+    data: str,
+    max_depth: int = 5,
+    beam_width: int = 3,
+    time_budget: Optional[float] = None,
+    try_rot: bool = True,
+    cache: Optional[Dict] = None,
+    max_candidates: int = LAYER_MAX_CANDIDATES,
+) -> DecodeChain:
+    """
+    Retire récursivement les couches d'encodage empilées.
+
+    Recherche en faisceau : à chaque profondeur on garde les `beam_width`
+    meilleures chaînes. Les résultats de detect_encodings sont mis en cache
+    par hash du contenu, donc deux chaînes qui aboutissent au même texte
+    intermédiaire ne le décodent qu'une fois. Chaque couche propose au plus
+    `max_candidates` candidats. On s'arrête à `max_depth` couches ou quand
+    `time_budget` (secondes) est écoulé ; l'échéance est vérifiée avant chaque
+    expansion, et les candidats d'une expansion déjà faite sont toujours gardés.
+    Renvoie la meilleure chaîne complète trouvée (éventuellement vide).
+    """
+    if cache is None:
+        cache = {}
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+
+    best = DecodeChain(decoded_text=data, score=score(data))
+    beam = [best]
+    visited = {_content_key(data)}
+
+    def expired():
+        return deadline is not None and time.monotonic() > deadline
+
+    for _ in range(max_depth):
+        next_beam: List[DecodeChain] = []
+        for chain in beam:
+            if expired():
+                break
+            # ROT∘ROT est encore un ROT : inutile d'enchaîner deux couches rot
+            last_rot = bool(chain.layers) and chain.layers[-1].source_fmt == "rot"
+            cands = _expand(chain.decoded_text, try_rot and not last_rot, cache, max_candidates)
+            # Une expansion terminée est toujours exploitée, même hors délai
+            for cand in cands:
+                key = _content_key(cand.decoded_text)
+                if key in visited:
+                    continue
+                visited.add(key)
+                next_beam.append(
+                    DecodeChain(
+                        layers=chain.layers + [cand],
+                        decoded_text=cand.decoded_text,
+                        score=cand.score,
+                    )
+                )
+        if not next_beam:
+            break
+        next_beam.sort(key=lambda c: c.score, reverse=True)
+        beam = next_beam[:beam_width]
+        # À score égal on garde la chaîne la plus courte (déjà en place)
+        if beam[0].score > best.score:
+            best = beam[0]
+        if expired():
+            break
+    return best
+
+@lru_cache(maxsize=4096)
+def _detect_cached(data, max_results, try_rot):
+    # Tuples immuables : un appelant qui modifie ses Candidate ne touche pas au cache
+    return tuple(astuple(c) for c in detect_encodings(data, max_results=max_results, try_rot=try_rot))
+
+
+def _detect_chunk(chunk, max_results, try_rot):
+    # Exécuté dans un worker : le cache LRU vit dans chaque processus
+    return [
+        [Candidate(*fields) for fields in _detect_cached(d, max_results, try_rot)]
+        for d in chunk
+    ]
+
+
+def _chunks(items, size):
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def detect_many(
+    items: Iterable[str],
+    max_results: int = 5,
+    try_rot: bool = True,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+) -> Iterator[List[Candidate]]:
+    """
+    Applique detect_encodings sur chaque élément de `items`.
+
+    Les éléments sont envoyés par paquets de `chunk_size` à un pool de
+    `workers` processus (os.cpu_count() par défaut, 1 = pas de pool).
+    Les résultats sont produits au fil de l'eau dans l'ordre d'entrée ;
+    le nombre de paquets en vol est borné, `items` peut donc être infini.
+    Les entrées répétées sont servies par un cache LRU.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for chunk in _chunks(items, chunk_size):
+            yield from _detect_chunk(chunk, max_results, try_rot)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(items, chunk_size):
+            pending.append(pool.submit(_detect_chunk, chunk, max_results, try_rot))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _read_inputs(paths, ndjson, key):
+    """(entrée, erreur) par ligne ; une ligne NDJSON illisible donne (None, message)"""
+    import json
+
+    for path in paths:
+        f = sys.stdin if path == "-" else open(path, encoding="utf-8", errors="replace")
+        try:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if not ndjson:
+                    yield line, None
+                    continue
+                if not line.strip():
+                    continue
+                try:
+                    obj = json.loads(line)
+                except ValueError as exc:
+                    yield None, f"JSON invalide: {exc}"
+                    continue
+                if not isinstance(obj, dict):
+                    yield str(obj), None
+                elif key not in obj:
+                    yield None, f"clé {key!r} absente"
+                else:
+                    value = obj[key]
+                    yield value if isinstance(value, str) else str(value), None
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def check_ranking(repeats=(10, 1000, 10000)):
+    """
+    Le décodage anglais d'un base64(gzip) doit passer devant les ROT du texte
+    base64 : les quadgrammes trouvent des fragments anglais dans tout bloc de
+    lettres (surtout quand gzip se répète), seule la structure de mots les
+    départage.
+    """
+    import base64
+    import gzip
+
+    sentences = (
+        "The quick brown fox jumps over the lazy dog. ",
+        "Hello world, this is a plain message. ",
+    )
+    for sentence in sentences:
+        for n in repeats:
+            data = base64.b64encode(gzip.compress((sentence * n).encode(), mtime=0)).decode()
+            cands = detect_encodings(data, max_results=8)
+            if cands[0].source_fmt != "base64+gzip":
+                return False
+    return True
+
+
+def main(argv=None):
+    # Imports locaux : le module reste rapide à importer
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(
+        description="Détection d'encodage en lot, une entrée par ligne, sortie NDJSON."
+    )
+    parser.add_argument("files", nargs="*", help="fichiers d'entrée ('-' = stdin)")
+    parser.add_argument("--ndjson", action="store_true", help="entrée au format NDJSON")
+    parser.add_argument("--field", default="data", help="clé à lire dans les objets NDJSON")
+    parser.add_argument("--max-results", type=int, default=5)
+    parser.add_argument("--no-rot", action="store_true", help="désactive les essais ROT-N")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    if not args.files:
+        DATA = "ZmxhZ3t0ZXN0fQ=="
+        detected = detect_encodings(DATA, max_results=args.max_results, try_rot=not args.no_rot)
+        print(f"Chaîne d'entrée : {DATA!r}\n")
+        for i, cand in enumerate(detected, 1):
+            extra = f" ({cand.extra_info})" if cand.extra_info else ""
+            print(f"[{i}] format supposé : {cand.source_fmt}{extra}")
+            print(f"    score : {cand.score:.3f}")
+            print(f"    texte : {cand.decoded_text!r}")
+            print()
+        print(f"Anglais devant les ROT du base64 : {check_ranking()}")
+        return
+
+    # Les lignes en erreur passent quand même dans le lot (entrée vide) pour
+    # garder les index ; leur enregistrement de sortie porte l'erreur.
+    errors = {}
+
+    def items():
+        for idx, (item, error) in enumerate(_read_inputs(args.files, args.ndjson, args.field)):
+            if error is not None:
+                errors[idx] = error
+                item = ""
+            yield item
+
+    results = detect_many(
+        items(),
+        max_results=args.max_results,
+        try_rot=not args.no_rot,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    out = sys.stdout
+    for idx, cands in enumerate(results):
+        if idx in errors:
+            record = {"index": idx, "error": errors.pop(idx)}
+        else:
+            record = {"index": idx, "candidates": [asdict(c) for c in cands]}
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write("\n")
+
+
 if __name__ == "__main__":
-    DATA = "ZmxhZ3t0ZXN0fQ=="
-    MAX_RESULTS = 5
-    TRY_ROT = True
-    detected = detect_encodings(DATA, max_results=MAX_RESULTS, try_rot=TRY_ROT)
-    print(f"Chaîne d'entrée : {DATA!r}\n")
-    for i, cand in enumerate(detected, 1):
-        extra = f" ({cand.extra_info})" if cand.extra_info else ""
-        print(f"[{i}] format supposé : {cand.source_fmt}{extra}")
-        print(f"    score : {cand.score:.3f}")
-        print(f"    texte : {cand.decoded_text!r}")
-        print()
+    main()
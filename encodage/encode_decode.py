@@ -12,6 +12,12 @@ Formats supportés:
 - "url"    : URL-encoding (percent-encoding)
 - "rot"    : ROT-N sur les lettres A-Z / a-z
 - "dec"    : entier base 10, interprété comme entier non signé
+- "base58", "base85", "ascii85", "uu", "qp" : voir extra_codecs.py (chargés
+  à la première utilisation)
+
+Nouveaux formats :
+    from encode_decode import register_codec
+    register_codec("rev", lambda s: s[::-1].encode(), lambda b: b.decode()[::-1])
 
 Utilisation comme module :
     from encode_decode import convert_str
@@ -21,9 +27,22 @@ Exemple base 10 :
     from encode_decode import convert_str
     dec_val = convert_str("hex", "dec", "ff")      # "255"
     hex_val = convert_str("dec", "hex", "255")     # "ff"
+
+Chaîne de décodages sans repasser par str entre les étapes :
+    from encode_decode import convert_chain
+    raw = convert_chain(["base64", "hex", "rot"], b"NjY2YzYxNjc=")  # bytes
+
+Conversion en flux (gros fichiers, mémoire constante) :
+    from encode_decode import convert_file
+    with open("dump.hex") as src, open("dump.b64", "w") as dst:
+        convert_file("hex", "base64", src, dst)
 """
 
 import base64
+import binascii
+import codecs
+import importlib
+import re
 import urllib.parse
 
 
@@ -45,91 +64,604 @@ def apply_rot(text, shift):
     return "".join(result)
 
 
-def to_bytes(source_fmt, data):
-    if source_fmt == "text":
-        return data.encode("utf-8")
-
-    if source_fmt == "hex":
-        cleaned = "".join(data.split())
-        return bytes.fromhex(cleaned)
-
-    if source_fmt == "base64":
-        return base64.b64decode(data, validate=False)
-
-    if source_fmt == "base32":
-        return base64.b32decode(data, casefold=True)
+# --- Conversion décimale pour les très grands entiers -------------------------
+#
+# int(s, 10) et str(n) sont quadratiques et limités à 4300 chiffres depuis
+# Python 3.11. Au-delà de _DEC_THRESHOLD chiffres on passe par un
+# diviser-pour-régner : str -> int coupe la chaîne en deux et recolle avec une
+# puissance de 10 (multiplication Karatsuba), int -> str coupe l'entier en bits
+# et recolle en Decimal, dont la multiplication (libmpdec) est sous-quadratique.
+# Les puissances intermédiaires sont mises en cache pendant la conversion.
+
+_DEC_THRESHOLD = 3000
+
+
+def _dec_str_to_int(s):
+    pow10 = {}
+
+    def power(k):
+        p = pow10.get(k)
+        if p is None:
+            if k <= _DEC_THRESHOLD:
+                p = 10**k
+            else:
+                p = power(k >> 1) ** 2
+                if k & 1:
+                    p *= 10
+            pow10[k] = p
+        return p
+
+    def inner(a, b):
+        if b - a <= _DEC_THRESHOLD:
+            return int(s[a:b])
+        mid = (a + b + 1) >> 1
+        return inner(a, mid) * power(b - mid) + inner(mid, b)
+
+    return inner(0, len(s))
+
+
+def _int_to_dec_str(n):
+    import decimal
+
+    ctx = decimal.Context(
+        prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+    ctx.traps[decimal.Inexact] = True
+    pow2 = {}
+
+    def power(k):
+        p = pow2.get(k)
+        if p is None:
+            if k <= 64:
+                p = decimal.Decimal(1 << k)
+            else:
+                p = ctx.multiply(power(k >> 1), power(k >> 1))
+                if k & 1:
+                    p = ctx.multiply(p, 2)
+            pow2[k] = p
+        return p
+
+    def inner(m, w):
+        if w <= 4 * _DEC_THRESHOLD:
+            return decimal.Decimal(m)
+        w2 = w >> 1
+        hi = m >> w2
+        lo = m - (hi << w2)
+        return ctx.add(ctx.multiply(inner(hi, w - w2), power(w2)), inner(lo, w2))
+
+    return str(inner(n, n.bit_length()))
+
+
+def _parse_dec(data):
+    s = data.strip()
+    sign = 1
+    if s[:1] in ("+", "-"):
+        sign = -1 if s[0] == "-" else 1
+        s = s[1:]
+    if len(s) > _DEC_THRESHOLD and s.isascii() and s.isdigit():
+        return sign * _dec_str_to_int(s)
+    return int(data, 10)
+
+
+def _format_dec(n):
+    if n.bit_length() > 4 * _DEC_THRESHOLD:
+        return _int_to_dec_str(n)
+    return str(n)
+
+
+# --- Format binaire -----------------------------------------------------------
+#
+# Une chaîne de bits est un entier en base 2 : int(bits, 2) et format(n, "b")
+# sont linéaires pour les bases puissances de 2 et évitent la boucle Python par
+# octet. Au-delà de _NUMPY_THRESHOLD bits on passe par packbits/unpackbits si
+# NumPy est installé.
+
+_NUMPY_THRESHOLD = 1 << 22
+_np = False  # False = pas encore essayé, None = absent
+
+
+def _numpy():
+    """NumPy est optionnel et n'est importé qu'au premier très gros binaire"""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np = numpy
+    return _np
+
+
+def _bits_to_bytes(bits):
+    """'0'/'1' (str ou bytes, longueur multiple de 8) -> bytes"""
+    if not bits:
+        return b""
+    np = _numpy() if len(bits) >= _NUMPY_THRESHOLD else None
+    if np is not None:
+        raw = bits.encode("ascii") if isinstance(bits, str) else bits
+        arr = np.frombuffer(raw, dtype=np.uint8) - ord("0")
+        if arr.max() > 1:
+            raise ValueError("Caractère non binaire.")
+        return np.packbits(arr).tobytes()
+    # int() accepte aussi signe, blancs et "_" : on n'autorise que 0 et 1
+    try:
+        raw = bits.encode("ascii") if isinstance(bits, str) else bytes(bits)
+    except UnicodeEncodeError:
+        raw = None
+    if raw is None or raw.translate(None, b"01"):
+        raise ValueError("Caractère non binaire.")
+    return int(raw, 2).to_bytes(len(bits) // 8, "big")
+
+
+def _bytes_to_bits(b):
+    """bytes -> chaîne de '0'/'1', 8 bits par octet"""
+    if not len(b):
+        return ""
+    np = _numpy() if len(b) * 8 >= _NUMPY_THRESHOLD else None
+    if np is not None:
+        arr = np.unpackbits(np.frombuffer(b, dtype=np.uint8)) + ord("0")
+        return arr.tobytes().decode("ascii")
+    return format(int.from_bytes(b, "big"), f"0{8 * len(b)}b")
+
+
+# --- Registre des codecs --------------------------------------------------------
+#
+# Chaque format est un Codec : decode (texte -> bytes), encode (bytes -> texte),
+# éventuellement des variantes bytes -> bytes (raw_*) et un validateur utilisé
+# par auto_detect_encoding. to_bytes / from_bytes sont un simple accès au
+# dictionnaire. Les formats supplémentaires (extra_codecs.py) sont déclarés par
+# leur nom et ne sont importés qu'à la première utilisation.
+#
+# "rot" prend un paramètre (rot_n) : il garde son traitement à part dans
+# convert / from_bytes, le codec enregistré correspond à ROT13.
+
+
+class Codec:
+    def __init__(self, name, decode, encode, raw_decode=None, raw_encode=None, validator=None):
+        self.name = name
+        self.decode = decode            # str -> bytes
+        self.encode = encode            # bytes -> str
+        self.raw_decode = raw_decode    # bytes-like -> bytes (optionnel)
+        self.raw_encode = raw_encode    # bytes-like -> bytes ASCII (optionnel)
+        self.validator = validator      # str -> bool, pour la détection (optionnel)
 
-    if source_fmt == "bin":
-        bits = "".join(data.split())
-        if len(bits) % 8 != 0:
-            raise ValueError("Longueur binaire non multiple de 8.")
-        return bytes(int(bits[i : i + 8], 2) for i in range(0, len(bits), 8))
+    def __repr__(self):
+        return f"Codec({self.name!r})"
 
-    if source_fmt == "url":
-        return urllib.parse.unquote_to_bytes(data)
 
-    if source_fmt == "dec":
-        n = int(data, 10)
-        if n < 0:
-            raise ValueError("Le format 'dec' ne supporte pas les valeurs négatives.")
-        if n == 0:
-            return b"\x00"
-        length = (n.bit_length() + 7) // 8
-        return n.to_bytes(length, "big")
+_CODECS = {}
+_LAZY_CODECS = {}  # nom -> module qui enregistre le codec à son import
 
-    raise ValueError(f"Format source non supporté: {source_fmt}")
+
+def register_codec(name, decode, encode, raw_decode=None, raw_encode=None, validator=None):
+    """Ajoute (ou remplace) un format utilisable par convert et detect_encodings"""
+    codec = Codec(name, decode, encode, raw_decode, raw_encode, validator)
+    _CODECS[name] = codec
+    _LAZY_CODECS.pop(name, None)
+    if name not in SUPPORTED_FORMATS:
+        SUPPORTED_FORMATS.append(name)
+    return codec
 
 
-def from_bytes(target_fmt, b, rot_n):
-    if target_fmt == "text":
-        return b.decode("utf-8", errors="replace")
+def register_lazy_codec(name, module):
+    """Déclare un format dont le module ne sera importé qu'à la première utilisation"""
+    if name in _CODECS:
+        return
+    _LAZY_CODECS[name] = module
+    if name not in SUPPORTED_FORMATS:
+        SUPPORTED_FORMATS.append(name)
+
+
+def get_codec(name):
+    codec = _CODECS.get(name)
+    if codec is None and name in _LAZY_CODECS:
+        importlib.import_module(_LAZY_CODECS.pop(name))
+        codec = _CODECS.get(name)
+    return codec
+
+
+def iter_codecs():
+    """Tous les codecs, dans l'ordre de SUPPORTED_FORMATS (charge les formats paresseux)"""
+    for name in list(SUPPORTED_FORMATS):
+        codec = get_codec(name)
+        if codec is not None:
+            yield codec
+
+
+def _get(fmt, role):
+    codec = get_codec(fmt)
+    if codec is None:
+        raise ValueError(f"Format {role} non supporté: {fmt}")
+    return codec
+
+
+# Formats de base
+
+_ASCII_WHITESPACE = b" \t\n\r\v\f"
+
+
+def _rot_table(shift):
+    shift %= 26
+    table = bytearray(range(256))
+    for base in (ord("a"), ord("A")):
+        for i in range(26):
+            table[base + i] = base + (i + shift) % 26
+    return bytes(table)
+
+
+_ROT_TABLES = [_rot_table(n) for n in range(26)]
+
+
+def _strip_ws(data):
+    return bytes(data).translate(None, _ASCII_WHITESPACE)
+
+
+def _as_bytes(data):
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+def _hex_decode(data):
+    cleaned = "".join(data.split())
+    return bytes.fromhex(cleaned)
+
+
+def _hex_raw_decode(data):
+    try:
+        return binascii.a2b_hex(data)
+    except (binascii.Error, ValueError):
+        return binascii.a2b_hex(_strip_ws(data))
+
+
+def _bin_decode(data):
+    bits = "".join(data.split())
+    if len(bits) % 8 != 0:
+        raise ValueError("Longueur binaire non multiple de 8.")
+    return _bits_to_bytes(bits)
+
+
+def _bin_raw_decode(data):
+    bits = _strip_ws(data)
+    if len(bits) % 8 != 0:
+        raise ValueError("Longueur binaire non multiple de 8.")
+    return _bits_to_bytes(bits)
+
+
+def _dec_decode(data):
+    n = _parse_dec(data)
+    if n < 0:
+        raise ValueError("Le format 'dec' ne supporte pas les valeurs négatives.")
+    if n == 0:
+        return b"\x00"
+    length = (n.bit_length() + 7) // 8
+    return n.to_bytes(length, "big")
+
+
+def _dec_encode(b):
+    return _format_dec(int.from_bytes(b, "big", signed=False))
+
+
+register_codec(
+    "text",
+    lambda data: data.encode("utf-8"),
+    lambda b: b.decode("utf-8", errors="replace"),
+    raw_decode=_as_bytes,
+    raw_encode=_as_bytes,
+)
+register_codec(
+    "hex",
+    _hex_decode,
+    lambda b: b.hex(),
+    raw_decode=_hex_raw_decode,
+    raw_encode=binascii.b2a_hex,
+)
+register_codec(
+    "base64",
+    lambda data: base64.b64decode(data, validate=False),
+    lambda b: base64.b64encode(b).decode("ascii"),
+    raw_decode=binascii.a2b_base64,
+    raw_encode=lambda b: binascii.b2a_base64(b, newline=False),
+)
+register_codec(
+    "base32",
+    lambda data: base64.b32decode(data, casefold=True),
+    lambda b: base64.b32encode(b).decode("ascii"),
+    raw_decode=lambda data: base64.b32decode(data, casefold=True),
+    raw_encode=base64.b32encode,
+)
+register_codec(
+    "bin",
+    _bin_decode,
+    _bytes_to_bits,
+    raw_decode=_bin_raw_decode,
+    raw_encode=lambda b: _bytes_to_bits(b).encode("ascii"),
+)
+register_codec(
+    "url",
+    urllib.parse.unquote_to_bytes,
+    urllib.parse.quote_from_bytes,
+    raw_decode=lambda data: urllib.parse.unquote_to_bytes(_as_bytes(data)),
+    raw_encode=lambda b: urllib.parse.quote_from_bytes(b).encode("ascii"),
+)
+register_codec(
+    "rot",
+    lambda data: apply_rot(data, -13).encode("utf-8"),
+    lambda b: apply_rot(b.decode("utf-8", errors="replace"), 13),
+)
+register_codec("dec", _dec_decode, _dec_encode)
+
+for _name in ("base58", "base85", "ascii85", "uu", "qp"):
+    register_lazy_codec(_name, "encodage.extra_codecs")
 
-    if target_fmt == "hex":
-        return b.hex()
 
-    if target_fmt == "base64":
-        return base64.b64encode(b).decode("ascii")
-
-    if target_fmt == "base32":
-        return base64.b32encode(b).decode("ascii")
-
-    if target_fmt == "bin":
-        return "".join(f"{byte:08b}" for byte in b)
+def to_bytes(source_fmt, data):
+    return _get(source_fmt, "source").decode(data)
 
-    if target_fmt == "url":
-        return urllib.parse.quote_from_bytes(b)
 
+def from_bytes(target_fmt, b, rot_n):
     if target_fmt == "rot":
         text = b.decode("utf-8", errors="replace")
         return apply_rot(text, rot_n)
-
-    if target_fmt == "dec":
-        n = int.from_bytes(b, "big", signed=False)
-        return str(n)
-
-    raise ValueError(f"Format cible non supporté: {target_fmt}")
+    return _get(target_fmt, "cible").encode(b)
 
 
 def convert(source_fmt, target_fmt, data, rot_n=13):
-    if source_fmt not in SUPPORTED_FORMATS:
-        raise ValueError(f"Format source non supporté: {source_fmt}")
-    if target_fmt not in SUPPORTED_FORMATS:
-        raise ValueError(f"Format cible non supporté: {target_fmt}")
-
     if source_fmt == "rot":
         data = apply_rot(data, -rot_n)
         source_fmt_effective = "text"
     else:
         source_fmt_effective = source_fmt
 
-    b = to_bytes(source_fmt_effective, data)
-    return from_bytes(target_fmt, b, rot_n)
+    decode = _get(source_fmt_effective, "source").decode
+    _get(target_fmt, "cible")
+    return from_bytes(target_fmt, decode(data), rot_n)
 
 
 def convert_str(source_fmt, target_fmt, data, rot_n=13):
     return convert(source_fmt, target_fmt, data, rot_n=rot_n)
 
 
+# --- Chemin bytes -> bytes ----------------------------------------------------
+#
+# Variantes de to_bytes / from_bytes qui lisent un objet bytes-like (bytes,
+# bytearray, memoryview) et renvoient des bytes. binascii et int() acceptent
+# directement les buffers, donc on évite les aller-retours str <-> bytes.
+# Un codec sans variante raw passe par sa version texte.
+
+
+def raw_to_bytes(source_fmt, data, rot_n=13):
+    """Comme to_bytes, mais `data` est un objet bytes-like (texte ASCII/UTF-8)"""
+    if source_fmt == "rot":
+        return bytes(data).translate(_ROT_TABLES[-rot_n % 26])
+    codec = _get(source_fmt, "source")
+    if codec.raw_decode is not None:
+        return codec.raw_decode(data)
+    return codec.decode(bytes(data).decode("utf-8"))
+
+
+def raw_from_bytes(target_fmt, b, rot_n=13):
+    """Comme from_bytes, mais renvoie la représentation encodée en bytes ASCII"""
+    if target_fmt == "rot":
+        return bytes(b).translate(_ROT_TABLES[rot_n % 26])
+    codec = _get(target_fmt, "cible")
+    if codec.raw_encode is not None:
+        return codec.raw_encode(b)
+    return codec.encode(_as_bytes(b)).encode("utf-8")
+
+
+def convert_chain(steps, data, rot_n=13, as_text=False):
+    """
+    Enchaîne plusieurs conversions en gardant les données en bytes.
+
+    Chaque étape est soit un format (on retire une couche : format -> "text"),
+    soit un couple (source, cible). La sortie d'une étape est l'entrée de la
+    suivante. `data` peut être str ou bytes-like ; le texte n'est produit qu'à
+    la fin si `as_text` est vrai.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    for step in steps:
+        source_fmt, target_fmt = (step, "text") if isinstance(step, str) else step
+        _get(target_fmt, "cible")
+        data = raw_from_bytes(target_fmt, raw_to_bytes(source_fmt, data, rot_n), rot_n)
+    if as_text:
+        return bytes(data).decode("utf-8", errors="replace")
+    return bytes(data) if not isinstance(data, bytes) else data
+
+
+# --- Conversion en flux -------------------------------------------------------
+#
+# Chaque format source a un décodeur incrémental (morceaux de str -> morceaux de
+# bytes) et chaque format cible un encodeur incrémental (bytes -> str). Les
+# décodeurs gardent en réserve la fin incomplète d'un morceau (quantum base64 de
+# 4 caractères, paire hex, octet binaire, séquence %XX) jusqu'au morceau suivant.
+# "dec" est l'exception : la valeur d'un entier dépend de tous ses chiffres, il
+# est donc bufferisé en entier, comme les codecs du registre sans version en flux.
+
+_B64_JUNK = re.compile(r"[^A-Za-z0-9+/=]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _quantum_decoder(chunks, quantum, clean, decode):
+    pending = ""
+    for chunk in chunks:
+        pending += clean(chunk)
+        cut = len(pending) - len(pending) % quantum
+        if cut:
+            yield decode(pending[:cut])
+            pending = pending[cut:]
+    if pending:
+        yield decode(pending)
+
+
+def _stream_to_bytes(source_fmt, chunks, rot_n):
+    if source_fmt == "text":
+        for chunk in chunks:
+            yield chunk.encode("utf-8")
+    elif source_fmt == "rot":
+        for chunk in chunks:
+            yield apply_rot(chunk, -rot_n).encode("utf-8")
+    elif source_fmt == "hex":
+        yield from _quantum_decoder(
+            chunks, 2, lambda c: _WHITESPACE.sub("", c), bytes.fromhex
+        )
+    elif source_fmt == "base64":
+        yield from _quantum_decoder(
+            chunks, 4, lambda c: _B64_JUNK.sub("", c), base64.b64decode
+        )
+    elif source_fmt == "base32":
+        yield from _quantum_decoder(
+            chunks,
+            8,
+            lambda c: _WHITESPACE.sub("", c),
+            lambda c: base64.b32decode(c, casefold=True),
+        )
+    elif source_fmt == "bin":
+        for part in _quantum_decoder(
+            chunks, 8, lambda c: _WHITESPACE.sub("", c), lambda c: c
+        ):
+            if len(part) % 8 != 0:
+                raise ValueError("Longueur binaire non multiple de 8.")
+            yield _bits_to_bytes(part)
+    elif source_fmt == "url":
+        pending = ""
+        for chunk in chunks:
+            pending += chunk
+            # Une séquence %XX peut être coupée entre deux morceaux
+            pct = pending.rfind("%", max(0, len(pending) - 2))
+            if pct == -1:
+                yield urllib.parse.unquote_to_bytes(pending)
+                pending = ""
+            else:
+                yield urllib.parse.unquote_to_bytes(pending[:pct])
+                pending = pending[pct:]
+        if pending:
+            yield urllib.parse.unquote_to_bytes(pending)
+    else:
+        # "dec" et les codecs sans découpage connu : bufferisés en entier
+        yield to_bytes(source_fmt, "".join(chunks))
+
+
+def _quantum_encoder(chunks, quantum, encode):
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        cut = len(pending) - len(pending) % quantum
+        if cut:
+            yield encode(pending[:cut])
+            pending = pending[cut:]
+    if pending:
+        yield encode(pending)
+
+
+def _text_decoder(chunks):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _stream_from_bytes(target_fmt, chunks, rot_n):
+    if target_fmt == "text":
+        yield from _text_decoder(chunks)
+    elif target_fmt == "rot":
+        for text in _text_decoder(chunks):
+            yield apply_rot(text, rot_n)
+    elif target_fmt == "hex":
+        for chunk in chunks:
+            yield chunk.hex()
+    elif target_fmt == "base64":
+        yield from _quantum_encoder(
+            chunks, 3, lambda b: base64.b64encode(b).decode("ascii")
+        )
+    elif target_fmt == "base32":
+        yield from _quantum_encoder(
+            chunks, 5, lambda b: base64.b32encode(b).decode("ascii")
+        )
+    elif target_fmt == "bin":
+        for chunk in chunks:
+            yield _bytes_to_bits(chunk)
+    elif target_fmt == "url":
+        for chunk in chunks:
+            yield urllib.parse.quote_from_bytes(chunk)
+    else:
+        yield from_bytes(target_fmt, b"".join(chunks), rot_n)
+
+
+def _iter_text_chunks(source, chunk_size):
+    """Accepte un fichier (texte ou binaire) ou un itérable de morceaux"""
+    if hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = iter(source)
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunk = decoder.decode(bytes(chunk))
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def decode_stream(source_fmt, source, rot_n=13, chunk_size=1 << 16):
+    """Décodage en flux vers des morceaux de bytes (données binaires, couche suivante)"""
+    _get(source_fmt, "source")
+    for out in _stream_to_bytes(source_fmt, _iter_text_chunks(source, chunk_size), rot_n):
+        if out:
+            yield out
+
+
+def convert_stream(source_fmt, target_fmt, source, rot_n=13, chunk_size=1 << 16):
+    """
+    Version en flux de convert() : `source` est un fichier ouvert ou un itérable
+    de morceaux de texte, le résultat est produit morceau par morceau.
+    La mémoire utilisée ne dépend que de `chunk_size` (sauf pour "dec").
+    """
+    _get(source_fmt, "source")
+    _get(target_fmt, "cible")
+
+    text_chunks = _iter_text_chunks(source, chunk_size)
+    byte_chunks = _stream_to_bytes(source_fmt, text_chunks, rot_n)
+    for out in _stream_from_bytes(target_fmt, byte_chunks, rot_n):
+        if out:
+            yield out
+
+
+def convert_file(source_fmt, target_fmt, src, dst, rot_n=13, chunk_size=1 << 16):
+    """Convertit le contenu du fichier `src` et l'écrit dans `dst` (mode texte)"""
+    for out in convert_stream(source_fmt, target_fmt, src, rot_n=rot_n, chunk_size=chunk_size):
+        dst.write(out)
+
+
+def check_stream(text="Stream check: héllo wörld ✓ " * 7):
+    """
+    Décode en flux des encodages coupés en lignes (retours à la ligne tous
+    les 7 caractères), découpés en morceaux de tailles variées pour que les
+    coupures tombent au milieu des quanta et des fins de ligne.
+    """
+    raw = text.encode("utf-8")
+    for fmt in ("hex", "base64", "base32", "bin", "url"):
+        encoded = from_bytes(fmt, raw, 13)
+        if fmt != "url":
+            # %XX ne tolère pas de blanc, les autres formats les ignorent
+            encoded = "\n".join(encoded[i : i + 7] for i in range(0, len(encoded), 7)) + "\n"
+        for size in (1, 3, 5, 8, 13):
+            chunks = [encoded[i : i + size] for i in range(0, len(encoded), size)]
+            try:
+                decoded = "".join(convert_stream(fmt, "text", chunks))
+            except ValueError:   # binascii.Error en est une sous-classe
+                return False
+            if decoded != text:
+                return False
+            if "".join(convert_stream("text", fmt, [text[:size], text[size:]])) != from_bytes(fmt, raw, 13):
+                return False
+    return True
+
+
 if __name__ == "__main__":
     SOURCE_FORMAT = "hex"
     TARGET_FORMAT = "dec"
@@ -138,3 +670,4 @@ if __name__ == "__main__":
 
     result = convert_str(SOURCE_FORMAT, TARGET_FORMAT, DATA, rot_n=ROT_SHIFT)
     print(result)
+    print(f"Conversion en flux (morceaux + retours à la ligne) : {check_stream()}")
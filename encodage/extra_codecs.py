@@ -0,0 +1,197 @@
+"""
+extra_codecs.py
+
+Formats supplémentaires pour encode_decode.py, chargés à la première utilisation
+(encode_decode ne fait que déclarer leurs noms) :
+- "base58"  : alphabet Bitcoin, les octets nuls en tête deviennent des '1'
+- "base85"  : Base85 (alphabet RFC 1924, base64.b85encode)
+- "ascii85" : Ascii85 / Adobe, les délimiteurs <~ ~> sont acceptés en entrée
+- "uu"      : uuencode (en-tête "begin", lignes de 45 octets, "end")
+- "qp"      : quoted-printable
+
+Utilisation :
+    from encode_decode import convert_str
+    convert_str("text", "base58", "hello")   # "Cn8eVZg"
+"""
+
+import base64
+import binascii
+import re
+
+from encodage.encode_decode import register_codec
+
+
+B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_INDEX = {c: i for i, c in enumerate(B58_ALPHABET)}
+_B58_BYTES = B58_ALPHABET.encode("ascii")
+# Chiffres base58 -> valeurs 0..57 (bytes.translate) ; les autres octets donnent
+# 0, b58decode les rejette avant la conversion
+_B58_VALUES = bytes(_B58_BYTES.index(c) if c in _B58_BYTES else 0 for c in range(256))
+_B58_ENCODE = _B58_BYTES + bytes(256 - 58)   # valeurs 0..57 -> chiffres
+_B58_CHUNK = 64          # en dessous : Horner, au-dessus : diviser-pour-régner
+# Les identifiants base58 (adresses, clés) sont courts ; au-delà, la détection
+# ne propose pas base58 (un long blob alphanumérique est plutôt du base64)
+B58_MAX_DETECT = 1024
+_B85_SYMBOLS = b"!#$%&()*+-;<=>?@^_`{|}~"
+_B85_BYTES = (
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz" + _B85_SYMBOLS
+)
+# "=XX" ou saut de ligne doux ; un "=" seul n'est pas du quoted-printable
+_QP_TOKEN = re.compile(r"=(?:([0-9A-F]{2})|\r?\n)?")
+# Octets qu'un encodeur quoted-printable échappe : non-ASCII, "=", blancs en
+# fin de ligne. "timeout=30" ou "price=25" (chiffres, "%") n'en sont pas.
+_QP_ESCAPED = frozenset(range(0x80, 0x100)) | {0x09, 0x0A, 0x0D, 0x20, 0x3D}
+
+
+# Conversions entier <-> chiffres base58 en diviser-pour-régner (comme "dec"
+# dans encode_decode) : on coupe en deux et on recolle avec une puissance de
+# 58 mise en cache, au lieu d'un n * 58 + c quadratique par caractère.
+
+
+def _b58_power(pows, k):
+    p = pows.get(k)
+    if p is None:
+        p = 58**k if k <= _B58_CHUNK else _b58_power(pows, k >> 1) ** 2 * 58 ** (k & 1)
+        pows[k] = p
+    return p
+
+
+def _b58_digits_to_int(values):
+    pows = {}
+
+    def inner(a, b):
+        if b - a <= _B58_CHUNK:
+            n = 0
+            for v in values[a:b]:
+                n = n * 58 + v
+            return n
+        mid = (a + b + 1) >> 1
+        return inner(a, mid) * _b58_power(pows, b - mid) + inner(mid, b)
+
+    return inner(0, len(values)) if values else 0
+
+
+def _int_to_b58_digits(n):
+    pows = {}
+
+    def inner(m, width):
+        # `width` chiffres exactement (zéros en tête compris)
+        if width <= _B58_CHUNK:
+            out = bytearray(width)
+            for i in range(width - 1, -1, -1):
+                m, out[i] = divmod(m, 58)
+            return bytes(out)
+        low = width >> 1
+        hi, lo = divmod(m, _b58_power(pows, low))
+        return inner(hi, width - low) + inner(lo, low)
+
+    # Nombre de chiffres : log58(2) ~ 0.1707, borne supérieure puis zéros retirés
+    width = int(n.bit_length() * 0.17073) + 2
+    return inner(n, width).lstrip(b"\x00")
+
+
+def b58encode(b):
+    pad = len(b) - len(b.lstrip(b"\x00"))
+    digits = _int_to_b58_digits(int.from_bytes(b, "big"))
+    return "1" * pad + digits.translate(_B58_ENCODE).decode("ascii")
+
+
+def b58decode(data):
+    s = data.strip()
+    raw = s.encode("ascii", errors="replace")
+    if raw.translate(None, _B58_BYTES):
+        bad = next(c for c in s if c not in _B58_INDEX)
+        raise ValueError(f"Caractère base58 invalide: {bad!r}")
+    n = _b58_digits_to_int(raw.translate(_B58_VALUES))
+    pad = len(s) - len(s.lstrip("1"))
+    body = n.to_bytes((n.bit_length() + 7) // 8, "big") if n else b""
+    return b"\x00" * pad + body
+
+
+def is_b58(s):
+    s = s.strip()
+    if not 2 <= len(s) <= B58_MAX_DETECT or not s.isascii():
+        return False
+    return not s.encode("ascii").translate(None, _B58_BYTES)
+
+
+def is_b85(s):
+    s = s.strip()
+    if len(s) < 5 or len(s) % 5 == 1 or not s.isascii():
+        return False
+    raw = s.encode("ascii")
+    # Un texte purement alphanumérique est plutôt du base64 / base58 / hex :
+    # on exige au moins un symbole propre à l'alphabet base85
+    return not raw.translate(None, _B85_BYTES) and len(raw.translate(None, _B85_SYMBOLS)) < len(raw)
+
+
+def a85decode(data):
+    s = data.strip()
+    return base64.a85decode(s, adobe=s.startswith("<~"))
+
+
+def is_a85(s):
+    s = s.strip()
+    return len(s) > 4 and s.startswith("<~") and s.endswith("~>")
+
+
+def uuencode(b):
+    lines = ["begin 644 data"]
+    for i in range(0, len(b), 45):
+        lines.append(binascii.b2a_uu(b[i : i + 45], backtick=True).decode("ascii").rstrip("\n"))
+    lines += ["`", "end"]
+    return "\n".join(lines) + "\n"
+
+
+def uudecode(data):
+    out = bytearray()
+    lines = data.splitlines()
+    if lines and lines[0].startswith("begin"):
+        lines = lines[1:]
+    for line in lines:
+        if line.strip() == "end":
+            break
+        if line:
+            out += binascii.a2b_uu(line)
+    return bytes(out)
+
+
+def is_uu(s):
+    return s.lstrip().startswith("begin ") and "\nend" in s
+
+
+def is_qp(s):
+    found = False
+    for m in _QP_TOKEN.finditer(s):
+        escaped = m.group(1)
+        if escaped is not None:
+            if int(escaped, 16) not in _QP_ESCAPED:
+                return False
+        elif m.end() - m.start() == 1 and s[m.end() :].strip():
+            return False   # "=" nu au milieu du texte
+        found = True
+    return found
+
+
+register_codec("base58", b58decode, b58encode, validator=is_b58)
+register_codec(
+    "base85",
+    lambda data: base64.b85decode(data.strip()),
+    lambda b: base64.b85encode(b).decode("ascii"),
+    validator=is_b85,
+)
+register_codec(
+    "ascii85",
+    a85decode,
+    lambda b: base64.a85encode(b).decode("ascii"),
+    validator=is_a85,
+)
+register_codec("uu", uudecode, uuencode, validator=is_uu)
+register_codec(
+    "qp",
+    lambda data: binascii.a2b_qp(data.encode("utf-8")),
+    lambda b: binascii.b2a_qp(b).decode("ascii"),
+    raw_decode=lambda data: binascii.a2b_qp(bytes(data)),
+    raw_encode=binascii.b2a_qp,
+    validator=is_qp,
+)
@@ -0,0 +1,190 @@
+"""
+magic_layers.py
+
+Reconnaissance des contenus binaires par "magic numbers" et décompression en
+flux des formats de la bibliothèque standard.
+
+Formats décompressés : gzip, zlib, bz2, xz, zip (premier fichier de l'archive)
+Formats seulement reconnus : png, jpeg, gif, pdf, elf
+
+La décompression est incrémentale : l'entrée est lue par morceaux et la
+sortie produite par morceaux, avec un plafond (`max_size`) au-delà duquel on
+s'arrête. Une charge qui se décompresse en centaines de Mo ne coûte donc que
+le plafond en mémoire.
+
+Utilisation comme module :
+    from magic_layers import sniff, decompress, iter_decompress
+    fmt = sniff(raw)                         # "gzip", "png", ... ou None
+    data, truncated = decompress(fmt, raw, max_size=1 << 20)
+    data, truncated = decompress(fmt, raw[:4096], partial=True)   # préfixe
+    for piece in iter_decompress("gzip", open("big.gz", "rb")):
+        ...
+"""
+
+import io
+import zlib
+
+CHUNK_SIZE = 1 << 16
+DEFAULT_MAX_SIZE = 1 << 20
+
+COMPRESSED_FORMATS = ("gzip", "zlib", "bz2", "xz", "zip")
+FILE_FORMATS = ("png", "jpeg", "gif", "pdf", "elf")   # reconnus, pas décodés
+
+_FILE_MAGICS = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"%PDF-", "pdf"),
+    (b"\x7fELF", "elf"),
+)
+
+
+class TruncatedStream(ValueError):
+    """Flux compressé coupé avant sa fin"""
+
+
+def sniff(raw):
+    """Format reconnu d'après les premiers octets, ou None"""
+    head = bytes(raw[:8])
+    if head[:2] == b"\x1f\x8b":
+        return "gzip"
+    if head[:6] == b"\xfd7zXZ\x00":
+        return "xz"
+    if head[:3] == b"BZh" and head[3:4].isdigit():
+        return "bz2"
+    if head[:4] == b"PK\x03\x04":
+        return "zip"
+    if (
+        len(head) >= 2
+        and head[0] & 0x0F == 8        # méthode deflate
+        and head[0] >> 4 <= 7          # fenêtre <= 32 Ko
+        and not head[1] & 0x20         # pas de dictionnaire prédéfini
+        and (head[0] << 8 | head[1]) % 31 == 0
+    ):
+        return "zlib"
+    for magic, name in _FILE_MAGICS:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _iter_chunks(source, chunk_size):
+    if hasattr(source, "read"):
+        yield from iter(lambda: source.read(chunk_size), b"")
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for i in range(0, len(view), chunk_size):
+            yield view[i : i + chunk_size]
+    else:
+        yield from source
+
+
+def _decompressor(fmt):
+    if fmt == "gzip":
+        return zlib.decompressobj(31)
+    if fmt == "zlib":
+        return zlib.decompressobj(15)
+    # bz2 / lzma / zipfile sont importés à la demande (import coûteux)
+    if fmt == "bz2":
+        import bz2
+
+        return bz2.BZ2Decompressor()
+    if fmt == "xz":
+        import lzma
+
+        return lzma.LZMADecompressor()
+    raise ValueError(f"Format compressé non supporté: {fmt}")
+
+
+def _drain(dec, data, chunk_size):
+    """Sortie de `dec` pour l'entrée `data`, morceaux d'au plus chunk_size octets"""
+    if hasattr(dec, "unconsumed_tail"):
+        # zlib : l'entrée non traitée (sortie plafonnée) revient dans unconsumed_tail
+        while True:
+            out = dec.decompress(data, chunk_size)
+            data = dec.unconsumed_tail
+            if out:
+                yield out
+            if dec.eof or (not data and len(out) < chunk_size):
+                return
+    out = dec.decompress(data, chunk_size)
+    while True:
+        if out:
+            yield out
+        if dec.eof or dec.needs_input:
+            return
+        out = dec.decompress(b"", chunk_size)
+
+
+def iter_decompress(fmt, source, max_size=None, chunk_size=CHUNK_SIZE):
+    """
+    Décompresse `source` (bytes, fichier binaire ou itérable de morceaux) et
+    produit la sortie par morceaux d'au plus `chunk_size` octets. S'arrête
+    après `max_size` octets produits (None = pas de limite). Les flux gzip /
+    bz2 / xz concaténés sont enchaînés. Un flux coupé avant sa fin lève
+    TruncatedStream une fois sa sortie produite.
+    """
+    if fmt == "zip":
+        yield from _iter_zip(source, max_size, chunk_size)
+        return
+
+    produced = 0
+    dec = _decompressor(fmt)
+    for chunk in _iter_chunks(source, chunk_size):
+        data = bytes(chunk)
+        while data:
+            if dec.eof:
+                if fmt == "zlib":
+                    return
+                # Membre suivant (gzip multi-membres, bz2 / xz concaténés)
+                dec = _decompressor(fmt)
+            for out in _drain(dec, data, chunk_size):
+                if max_size is not None and produced + len(out) >= max_size:
+                    yield out[: max_size - produced]
+                    return
+                produced += len(out)
+                yield out
+            data = dec.unused_data if dec.eof else b""
+    if not dec.eof:
+        raise TruncatedStream(f"Flux {fmt} tronqué")
+
+
+def _iter_zip(source, max_size, chunk_size):
+    import zipfile
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(bytes(source))
+    elif not hasattr(source, "seek"):
+        source = io.BytesIO(b"".join(bytes(c) for c in _iter_chunks(source, chunk_size)))
+    with zipfile.ZipFile(source) as zf:
+        names = [i for i in zf.infolist() if not i.is_dir()]
+        if not names:
+            return
+        produced = 0
+        with zf.open(names[0]) as member:
+            for out in iter(lambda: member.read(chunk_size), b""):
+                if max_size is not None and produced + len(out) >= max_size:
+                    yield out[: max_size - produced]
+                    return
+                produced += len(out)
+                yield out
+
+
+def decompress(fmt, raw, max_size=DEFAULT_MAX_SIZE, partial=False):
+    """
+    (octets décompressés, tronqué ?) ; au plus `max_size` octets. Avec
+    `partial=True`, une entrée coupée avant la fin du flux (préfixe d'une
+    charge) donne la sortie obtenue jusque-là, marquée tronquée, au lieu de
+    lever TruncatedStream.
+    """
+    out = bytearray()
+    try:
+        for piece in iter_decompress(fmt, raw, max_size=max_size + 1):
+            out += piece
+    except TruncatedStream:
+        if not partial:
+            raise
+        return bytes(out[:max_size]), True
+    truncated = len(out) > max_size
+    return bytes(out[:max_size]), truncated
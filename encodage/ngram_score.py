@@ -0,0 +1,128 @@
+"""
+ngram_score.py
+
+Modèle de langue par quadgrammes (anglais) pour classer les candidats.
+
+Format du fichier english_quadgrams.bin :
+    - en-tête : b"QGRM", version (uint32), plancher et pas (2 x float64)
+    - 26^4 octets : log10(P(quadgramme)) quantifié sur 8 bits,
+      log10p = plancher + octet * pas, indexé par a*26^3 + b*26^2 + c*26 + d
+
+Le fichier est mappé en mémoire (mmap) au premier appel, rien n'est parsé à
+l'import. Le score se calcule en une passe, fenêtre glissante sur les lettres
+A-Z du texte (les autres caractères sont ignorés).
+
+Utilisation comme module :
+    from ngram_score import quadgram_fitness, english_likeness
+    quadgram_fitness("attack at dawn")   # log10 moyen par quadgramme
+    english_likeness("attack at dawn")   # ramené dans [0, 1]
+
+La table livrée est construite sur ~10 Mo d'anglais (Opticks de Newton,
+textes de licences libres, documentation de Vim). Pour la regénérer :
+    python -m encodage.ngram_score corpus1.txt corpus2.txt ...
+"""
+
+import math
+import mmap
+import os
+import struct
+import sys
+
+QUADGRAM_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "english_quadgrams.bin")
+_MAGIC = b"QGRM"
+_HEADER = struct.Struct("<4sIdd")
+_SIZE = 26**4
+_MAX_LETTERS = 1 << 16   # au-delà on ne note que le début du texte
+
+# Repères pour english_likeness : texte anglais courant vs lettres uniformes
+ENGLISH_FITNESS = -4.5
+RANDOM_FITNESS = -7.5
+
+# Lettres -> 0..25 (majuscules et minuscules), tout le reste est supprimé
+_LETTER_TABLE = bytearray(range(256))
+for _i in range(26):
+    _LETTER_TABLE[ord("A") + _i] = _i
+    _LETTER_TABLE[ord("a") + _i] = _i
+_LETTER_TABLE = bytes(_LETTER_TABLE)
+_NON_LETTERS = bytes(c for c in range(256) if not chr(c).isascii() or not chr(c).isalpha())
+
+_table = None
+
+
+def build_quadgram_file(texts, path=QUADGRAM_FILE):
+    """Compte les quadgrammes de `texts` et écrit la table quantifiée"""
+    counts = [0] * _SIZE
+    for text in texts:
+        idx = _letters(text)
+        q = 0
+        for i, c in enumerate(idx):
+            q = (q * 26 + c) % _SIZE
+            if i >= 3:
+                counts[q] += 1
+    total = sum(counts)
+    floor = math.log10(0.01 / total)
+    top = max(math.log10(c / total) for c in counts if c)
+    step = (top - floor) / 255
+    table = bytearray(_SIZE)
+    for q, c in enumerate(counts):
+        if c:
+            table[q] = max(1, round((math.log10(c / total) - floor) / step))
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, 1, floor, step))
+        f.write(table)
+
+
+def load_quadgrams(path=QUADGRAM_FILE):
+    """(table, plancher, pas) ; la table est une vue sur le fichier mappé"""
+    global _table
+    if _table is None or path != QUADGRAM_FILE:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, floor, step = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != 1:
+            raise ValueError(f"Fichier de quadgrammes invalide: {path}")
+        loaded = (memoryview(mm)[_HEADER.size : _HEADER.size + _SIZE], floor, step)
+        if path != QUADGRAM_FILE:
+            return loaded
+        _table = loaded
+    return _table
+
+
+def _letters(text):
+    """Indices 0..25 des lettres ASCII de `text` (bytes)"""
+    if isinstance(text, str):
+        text = text.encode("ascii", errors="ignore")
+    return bytes(text).translate(_LETTER_TABLE, _NON_LETTERS)
+
+
+def quadgram_fitness(text):
+    """log10 moyen par quadgramme, None s'il y a moins de 4 lettres"""
+    idx = _letters(text)[:_MAX_LETTERS]
+    n = len(idx) - 3
+    if n <= 0:
+        return None
+    table, floor, step = load_quadgrams()
+    q = idx[0] * 676 + idx[1] * 26 + idx[2]
+    total = 0
+    for c in idx[3:]:
+        q = (q % 17576) * 26 + c
+        total += table[q]
+    return floor + step * total / n
+
+
+def english_likeness(text):
+    """Fitness ramenée dans [0, 1] (0 = lettres au hasard, 1 = anglais)"""
+    fit = quadgram_fitness(text)
+    if fit is None:
+        return None
+    x = (fit - RANDOM_FITNESS) / (ENGLISH_FITNESS - RANDOM_FITNESS)
+    return min(1.0, max(0.0, x))
+
+
+if __name__ == "__main__":
+    corpus = []
+    for name in sys.argv[1:]:
+        with open(name, encoding="utf-8", errors="ignore") as f:
+            corpus.append(f.read())
+    build_quadgram_file(corpus)
+    print(f"Table écrite dans {QUADGRAM_FILE}")
@@ -0,0 +1,210 @@
+"""
+stream_detect.py
+
+Détection incrémentale du format d'un flux, à partir de son début.
+
+StreamDetector consomme le flux par morceaux :
+    - il tient à jour, pour chaque format à alphabet fixe (hex, base64, ...),
+      un indicateur "encore possible" sur tout ce qui a été lu : un seul
+      caractère hors alphabet élimine le format ;
+    - à des points de contrôle (taille du préfixe qui double), il lance
+      detect_encodings sur le préfixe et compare les meilleurs candidats ;
+    - il s'engage sur un format dès que l'écart avec le second dépasse
+      `threshold`, ou que le même format gagne `stable_checks` fois de suite,
+      ou au plus tard à `max_prefix` caractères.
+Ensuite decoded() décode tout le flux (préfixe bufferisé + suite) en flux,
+couche par couche (format de base, XOR, décompression). Le préfixe est
+souvent une charge coupée (gzip sans sa fin, ...) : la détection garde alors
+la sortie partielle au lieu d'écarter la couche.
+
+La latence de détection dépend de `max_prefix`, pas de la taille du flux.
+
+Utilisation comme module :
+    from stream_detect import StreamDetector
+    with open("capture.txt") as f:
+        det = StreamDetector()
+        for chunk in iter(lambda: f.read(4096), ""):
+            if det.feed(chunk):
+                break
+        print(det.close().source_fmt)
+        for text in det.decoded(iter(lambda: f.read(1 << 16), "")):
+            ...
+"""
+
+import codecs
+import string
+from dataclasses import replace
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional
+
+from encodage.auto_detect_encoding import Candidate, _raw_bytes, detect_encodings
+from encodage.encode_decode import convert_stream, decode_stream
+from encodage.magic_layers import COMPRESSED_FORMATS, FILE_FORMATS, iter_decompress
+
+_WS = string.whitespace
+# Caractères qu'un format peut contenir (blancs compris : retours à la ligne)
+ALPHABETS = {
+    "hex": string.hexdigits + _WS,
+    "base64": string.ascii_letters + string.digits + "+/=" + _WS,
+    "base32": string.ascii_letters + "234567=" + _WS,
+    "bin": "01" + _WS,
+}
+_ALPHABET_BYTES = {fmt: chars.encode("ascii") for fmt, chars in ALPHABETS.items()}
+
+
+class StreamDetector:
+    def __init__(
+        self,
+        threshold: float = 0.3,
+        min_prefix: int = 1024,
+        max_prefix: int = 1 << 16,
+        stable_checks: int = 2,
+        try_rot: bool = True,
+        try_xor: bool = True,
+    ):
+        self.threshold = threshold
+        self.max_prefix = max_prefix
+        self.stable_checks = stable_checks
+        self.try_rot = try_rot
+        self.try_xor = try_xor
+        self.verdict: Optional[Candidate] = None
+        self.alive = {fmt: True for fmt in ALPHABETS}
+        self._parts: List[str] = []
+        self._size = 0
+        self._next_check = min_prefix
+        self._last_top = None
+        self._stable = 0
+
+    def feed(self, chunk: str) -> Optional[Candidate]:
+        """
+        Ajoute un morceau ; renvoie le verdict dès qu'il est pris. Seuls les
+        morceaux lus avant le verdict sont gardés : la suite du flux se passe
+        à decoded(), pas à feed().
+        """
+        if self.verdict is not None:
+            raise ValueError("Format déjà retenu : passer la suite du flux à decoded()")
+        self._parts.append(chunk)
+        self._size += len(chunk)
+        raw = chunk.encode("ascii", errors="replace")
+        for fmt, allowed in _ALPHABET_BYTES.items():
+            if self.alive[fmt] and raw.translate(None, allowed):
+                self.alive[fmt] = False
+        if self._size >= self._next_check or self._size >= self.max_prefix:
+            self._check(final=self._size >= self.max_prefix)
+            self._next_check = 2 * self._size
+        return self.verdict
+
+    def close(self) -> Optional[Candidate]:
+        """Fin du flux (ou du préfixe) : force un verdict sur ce qui a été lu"""
+        if self.verdict is None and self._size:
+            self._check(final=True)
+        return self.verdict
+
+    def _prefix(self):
+        """(préfixe lu, préfixe soumis à la détection)"""
+        full = "".join(self._parts)[: self.max_prefix]
+        prefix = full
+        if " " not in prefix:
+            # Données encodées coupées en lignes : on recolle les lignes
+            prefix = "".join(prefix.split())
+            if len(prefix) >= 8 and any(self.alive.values()):
+                # Préfixe aligné pour les quanta base64 / base32 / bin
+                prefix = prefix[: len(prefix) - len(prefix) % 8]
+        return full, prefix
+
+    def _possible(self, cand):
+        base = cand.source_fmt.split("+")[0]
+        return self.alive.get(base, True)
+
+    def _check(self, final=False):
+        full, prefix = self._prefix()
+        cands = [
+            c
+            for c in detect_encodings(
+                prefix, max_results=8, try_rot=self.try_rot, try_xor=self.try_xor
+            )
+            if self._possible(c)
+        ]
+        if not cands:
+            return
+        top = cands[0]
+        key = (top.source_fmt, top.extra_info)
+        self._stable = self._stable + 1 if key == self._last_top else 1
+        self._last_top = key
+        margin = top.score - cands[1].score if len(cands) > 1 else top.score
+        if final or margin >= self.threshold or self._stable >= self.stable_checks:
+            if len(prefix) < len(full) and top.source_fmt.split("+")[0] not in ALPHABETS:
+                # Format sans quanta (texte, rot, ...) : l'alignement a coupé
+                # la fin du texte rapporté, on le redécode sur tout le préfixe
+                try:
+                    top = replace(top, decoded_text="".join(decode_candidate_stream(top, [full])))
+                except ValueError:
+                    pass
+            self.verdict = top
+
+    def decoded(self, rest: Iterable[str] = ()) -> Iterator[str]:
+        """Texte décodé de tout le flux : préfixe déjà lu puis `rest`"""
+        if self.verdict is None:
+            raise ValueError("Aucun format retenu : appeler feed() / close() d'abord")
+        return decode_candidate_stream(self.verdict, chain(self._parts, rest))
+
+
+def _xor_key(extra_info):
+    if extra_info.startswith("XOR=0x"):
+        return bytes([int(extra_info[6:], 16)])
+    return bytes.fromhex(extra_info.split("=", 1)[1])
+
+
+def _xor_stream(chunks, key):
+    pos = 0
+    for chunk in chunks:
+        n = len(chunk)
+        if not n:
+            continue
+        offset = pos % len(key)
+        stream = (key[offset:] + key * (n // len(key) + 1))[:n]
+        x = int.from_bytes(chunk, "big") ^ int.from_bytes(stream, "big")
+        yield x.to_bytes(n, "big")
+        pos += n
+
+
+def decode_candidate_stream(cand: Candidate, chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Décode un flux de texte selon les couches d'un candidat (ex: "base64+gzip").
+    Un fichier reconnu (png, pdf, ...) n'a pas de texte : ses octets sont
+    rendus tels quels, un caractère latin-1 par octet.
+    """
+    layers = cand.source_fmt.split("+")
+    base = layers[0]
+    if base == "text(raw)":
+        yield from chunks
+        return
+    if base == "rot":
+        shift = int(cand.extra_info.split("=", 1)[1])
+        yield from convert_stream("rot", "text", chunks, rot_n=shift)
+        return
+    if base == "xor":
+        byte_chunks = (_raw_bytes(c) for c in chunks)
+        next_layers = layers
+    else:
+        byte_chunks = decode_stream(base, chunks)
+        next_layers = layers[1:]
+    text_codec = "utf-8"
+    for layer in next_layers:
+        if layer in FILE_FORMATS:
+            text_codec = "latin-1"
+            break
+        if layer == "xor":
+            byte_chunks = _xor_stream(byte_chunks, _xor_key(cand.extra_info))
+        elif layer in COMPRESSED_FORMATS:
+            byte_chunks = iter_decompress(layer, byte_chunks)
+        else:
+            raise ValueError(f"Couche non décodable en flux: {layer}")
+    decoder = codecs.getincrementaldecoder(text_codec)(errors="replace")
+    for piece in byte_chunks:
+        text = decoder.decode(piece)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
@@ -0,0 +1,151 @@
+"""
+xor_detect.py
+
+Récupération de clé XOR (un octet ou clé courte répétée) par histogrammes.
+
+Idée :
+    - XOR avec une clé d'un octet k permute les valeurs : l'octet v du chiffré
+      devient v ^ k. Le score d'une clé se calcule donc sur l'histogramme des
+      256 valeurs, sans déchiffrer : score(k) = sum_v hist[v] * poids[v ^ k].
+      Les 256 clés sont notées d'un coup : produit matrice 256x256 . histogramme
+      avec NumPy (quelle que soit la taille), sinon somme des lignes
+      précalculées poids[v ^ k] des seules valeurs présentes.
+    - Clé répétée : on estime la longueur par distance de Hamming normalisée
+      entre le chiffré et lui-même décalé, puis chaque colonne (octets i, i+L, i+2L, ...)
+      est un XOR d'un octet, résolu avec le même histogramme.
+
+Utilisation comme module :
+    from xor_detect import single_byte_xor, repeating_key_xor, xor_bytes
+    key, _ = single_byte_xor(ciphertext)[0]
+    plain = xor_bytes(ciphertext, bytes([key]))
+"""
+
+import math
+from collections import Counter
+from itertools import repeat
+from operator import add, mul
+
+# Fréquences approximatives des lettres anglaises (+ espace), en %
+_ENGLISH_FREQ = {
+    " ": 15.0, "e": 10.2, "t": 7.5, "a": 6.5, "o": 6.2, "i": 5.7, "n": 5.7,
+    "s": 5.3, "r": 5.0, "h": 4.9, "l": 3.3, "d": 3.5, "u": 2.3, "c": 2.3,
+    "m": 2.0, "f": 1.9, "w": 1.7, "g": 1.6, "y": 1.6, "p": 1.6, "b": 1.2,
+    "v": 0.8, "k": 0.6, "x": 0.15, "j": 0.1, "q": 0.1, "z": 0.07,
+}
+
+
+def _byte_weights():
+    weights = [-8.0] * 256            # octets de contrôle : très improbables
+    for v in range(0x20, 0x7F):
+        weights[v] = math.log(0.3)    # ponctuation, chiffres
+    for v in range(0x80, 0x100):
+        weights[v] = -4.0             # UTF-8 possible mais rare
+    weights[ord("\n")] = math.log(1.0)
+    for ch, freq in _ENGLISH_FREQ.items():
+        weights[ord(ch)] = math.log(freq)
+        if ch.isalpha():
+            weights[ord(ch.upper())] = math.log(freq / 4)
+    return weights
+
+
+BYTE_WEIGHTS = _byte_weights()
+_np = False  # False = pas encore essayé, None = absent
+_np_matrix = None
+_rows = None   # _rows[v][k] = BYTE_WEIGHTS[v ^ k], construit au premier appel
+
+
+def _numpy():
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np = numpy
+    return _np
+
+
+def key_scores(data):
+    """Score (log-vraisemblance) des 256 clés d'un octet pour `data`"""
+    global _np_matrix, _rows
+    np = _numpy()
+    if np is not None:
+        hist = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+        if _np_matrix is None:
+            idx = np.arange(256)
+            _np_matrix = np.asarray(BYTE_WEIGHTS)[idx[:, None] ^ idx[None, :]]
+        return (_np_matrix @ hist).tolist()
+    if _rows is None:
+        w = BYTE_WEIGHTS
+        _rows = [[w[v ^ k] for k in range(256)] for v in range(256)]
+    # Une ligne de 256 scores par valeur présente (quelques dizaines pour du texte)
+    scores = [0.0] * 256
+    for v, c in Counter(data).items():
+        row = _rows[v] if c == 1 else map(mul, repeat(c, 256), _rows[v])
+        scores = list(map(add, scores, row))
+    return scores
+
+
+def single_byte_xor(data, top=1):
+    """Les `top` meilleures clés d'un octet : liste de (clé, score)"""
+    scores = key_scores(data)
+    if top == 1:
+        best = max(range(256), key=scores.__getitem__)
+        return [(best, scores[best])]
+    order = sorted(range(256), key=scores.__getitem__, reverse=True)
+    return [(k, scores[k]) for k in order[:top]]
+
+
+def xor_bytes(data, key):
+    """data XOR clé répétée"""
+    n = len(data)
+    if not n:
+        return b""
+    stream = (key * (n // len(key) + 1))[:n]
+    x = int.from_bytes(data, "big") ^ int.from_bytes(stream, "big")
+    return x.to_bytes(n, "big")
+
+
+def hamming(a, b):
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).bit_count()
+
+
+def guess_key_lengths(data, max_len=40, top=3, tolerance=1.1):
+    """
+    Longueurs de clé les plus probables.
+
+    Pour chaque longueur L on compare `data` avec lui-même décalé de L : la
+    distance de Hamming moyenne par octet est plus faible quand L est un
+    multiple de la période de la clé (deux octets de texte clair XOR la même
+    clé). Un seul XOR d'entiers par longueur, quelle que soit la taille.
+    Parmi les longueurs proches du minimum, les plus courtes passent d'abord
+    (les multiples de la vraie période ont la même distance).
+    """
+    scored = []
+    for size in range(1, min(max_len, len(data) // 2) + 1):
+        dist = hamming(data[:-size], data[size:]) / (len(data) - size)
+        scored.append((dist, size))
+    if not scored:
+        return []
+    best = min(dist for dist, _ in scored)
+    close = sorted(size for dist, size in scored if dist <= best * tolerance)
+    rest = [size for _, size in sorted(scored) if size not in close]
+    return (close + rest)[:top]
+
+
+def _shortest_period(key):
+    for p in range(1, len(key)):
+        if len(key) % p == 0 and key == key[:p] * (len(key) // p):
+            return key[:p]
+    return key
+
+
+def repeating_key_xor(data, max_len=40, top_lengths=3):
+    """Clés répétées candidates (bytes), une par longueur estimée"""
+    keys = []
+    for size in guess_key_lengths(data, max_len=max_len, top=top_lengths):
+        key = bytes(single_byte_xor(data[i::size])[0][0] for i in range(size))
+        key = _shortest_period(key)
+        if key not in keys:
+            keys.append(key)
+    return keys
@@ -0,0 +1,57 @@
+"""
+post_quantum
+
+Schémas post-quantiques simplifiés (Kyber, Dilithium, SPHINCS, Lamport, LWE).
+
+L'import du paquet ne fait aucun calcul : chaque sous-module n'est chargé
+qu'au premier accès (PEP 562), et aucun module ne lance de démo à l'import.
+
+Utilisation comme module :
+    import post_quantum
+    kyber = post_quantum.KyberImplementation()     # charge post_quantum.kyber
+    from post_quantum.dilithium import DilithiumImplementation
+
+Démos et mesures :
+    python -m post_quantum                  # démo de chaque schéma
+    python -m post_quantum kyber sphincs    # démos choisies
+    python -m post_quantum --import-time    # temps d'import de chaque sous-module
+"""
+
+import importlib
+
+SUBMODULES = ("kyber", "dilithium", "sphincs", "lamport_ots", "lwe_kem")
+
+# Noms réexportés -> sous-module qui les définit
+_EXPORTS = {
+    "KyberImplementation": "kyber",
+    "KyberParams": "kyber",
+    "KeypairPool": "kyber",
+    "KYBER512": "kyber",
+    "KYBER768": "kyber",
+    "KYBER1024": "kyber",
+    "DilithiumImplementation": "dilithium",
+    "SPHINCS_Simple": "sphincs",
+    "WOTS": "sphincs",
+    "lamport_keygen": "lamport_ots",
+    "lamport_sign": "lamport_ots",
+    "lamport_verify": "lamport_ots",
+    "lwe_keygen": "lwe_kem",
+    "lwe_encaps": "lwe_kem",
+    "lwe_decaps": "lwe_kem",
+}
+
+__all__ = list(SUBMODULES) + list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+        globals()[name] = value   # les accès suivants ne passent plus par ici
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
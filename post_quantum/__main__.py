@@ -0,0 +1,62 @@
+"""
+python -m post_quantum [schéma ...] [--import-time]
+
+Lance la démo des schémas demandés (tous par défaut), ou mesure le temps
+d'import de chaque sous-module dans un interpréteur neuf.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+
+from post_quantum import SUBMODULES
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TIMER = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_time(module, repeat=3):
+    """Meilleur temps d'import (ms) de `module`, chaque essai dans un processus neuf"""
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(module=module)],
+            cwd=_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        elapsed = 1000 * float(out.strip().splitlines()[-1])
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Démos des schémas post-quantiques.")
+    parser.add_argument("schemes", nargs="*", choices=[[]] + list(SUBMODULES), default=[])
+    parser.add_argument(
+        "--import-time", action="store_true", help="mesure le temps d'import des sous-modules"
+    )
+    args = parser.parse_args(argv)
+    schemes = args.schemes or SUBMODULES
+
+    if args.import_time:
+        print(f"{'post_quantum':24} {import_time('post_quantum'):7.1f} ms")
+        for name in schemes:
+            module = f"post_quantum.{name}"
+            print(f"{module:24} {import_time(module):7.1f} ms")
+        return
+
+    for name in schemes:
+        print(f"=== {name}")
+        importlib.import_module(f"post_quantum.{name}").demo()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1504 @@
+"""
+Implémentation simplifiée d’un KEM de type CRYSTALS-Kyber.
+
+Objectif :
+    Illustrer les idées principales de Kyber (polynômes, matrice A, bruit, encaps/decaps).
+
+Résumé :
+    - On travaille dans l’anneau R = Z_q[X] / (X^N + 1) avec :
+        N = 256
+        Q = 3329
+    - On manipule des vecteurs/matrices de polynômes modulo Q et X^N + 1.
+    - Les autres paramètres dépendent du jeu (class KyberParams) :
+                      K   eta1  eta2  du  dv
+        Kyber-512     2    3     2    10   4
+        Kyber-768     3    2     2    10   4
+        Kyber-1024    4    2     2    11   5
+
+Composants :
+    - class Polynomial:
+        Représente un polynôme de degré < N avec coefficients modulo Q.
+        Opérations supportées :
+            - addition, soustraction
+            - multiplication par NTT (O(N log N)), la version naïve O(N^2)
+              reste disponible (mul_naive) pour comparaison
+            - compression / décompression des coefficients
+            - conversion en bytes
+
+    - ntt(coeffs) / intt(coeffs) / basemul(a, b):
+        NTT de Kyber pour q = 3329 (zeta = 17, racine 256-ième de l'unité).
+        X^256 + 1 se factorise en 128 polynômes de degré 2 (X^2 - gamma_i) :
+        7 niveaux de papillons, produit point à point sur les paires de
+        coefficients, puis NTT inverse. Tables de zetas précalculées à l'import.
+
+    - class KyberParams (KYBER512, KYBER768, KYBER1024, PARAMETER_SETS):
+        Jeu de paramètres : K, eta1, eta2, du, dv, tailles des clés et chiffrés.
+        Les tables de compression et du sampler CBD sont construites une fois,
+        au premier usage du jeu, et partagées par toutes les instances (et
+        entre jeux quand du, dv ou eta coïncident) ; KyberImplementation les
+        lit dans params.*_tables. Le cache de A est indexé par (rho, K).
+
+    - cbd(buffer, eta) / cbd_array(buffer, eta):
+        Génère un polynôme de bruit selon une distribution binomiale centrée
+        à partir de 64*eta octets (bits lus poids faible d'abord). Table de
+        correspondance octet -> coefficients (mots de 3 octets pour eta = 3) ;
+        cbd_array tire K polynômes d'un seul buffer avec NumPy.
+
+    - sample_ntt(rho, i, j) / parse(rho):
+        Matrice publique A (K x K) tirée par rejet dans un flux SHAKE-128(rho || j || i) :
+        deux candidats de 12 bits par groupe de 3 octets, gardés s'ils sont < Q.
+        Comme dans Kyber, A est tirée directement en forme NTT.
+
+    - class PolyVec:
+        Vecteur de polynômes (backend "python") stocké comme listes de
+        coefficients. Les produits A * v, A^T * v et a^T * b passent par un
+        noyau fusionné (mat_vec_ntt / inner_ntt) : les K produits point à point
+        sont accumulés sans réduction et réduits une seule fois (réduction
+        paresseuse), sans Polynomial intermédiaire.
+
+    - expand_matrix(rho) / expand_matrix_array(rho):
+        Matrice A dérivée de rho, directement en forme NTT, gardée dans un cache
+        LRU borné (MATRIX_CACHE_SIZE entrées) : un même rho n'est développé
+        qu'une fois par processus.
+
+    - byte_encode(coeffs, d) / byte_decode(data, d) (+ variantes _array) :
+        Sérialisation compacte : coefficients de d bits empaquetés (poids
+        faible d'abord), 32*d octets par polynôme. Décodage sans copie depuis
+        un memoryview. Tailles réelles :
+                          clé publique   chiffré   clé secrète
+            Kyber-512          800          768        768
+            Kyber-768         1184         1088       1152
+            Kyber-1024        1568         1568       1536
+
+    - class PreparedPublicKey:
+        Clé publique préparée pour des encapsulations répétées : A et t sont
+        gardés en forme NTT, encaps ne refait ni l'expansion de A ni leur NTT.
+
+    - class PreparedSecretKey:
+        Clé secrète avec s en forme NTT : decaps ne fait plus que la NTT de u,
+        les produits point à point et une NTT inverse.
+
+    - class KyberImplementation(backend="python", params=KYBER512):
+        .keygen():
+            - Génère une graine aléatoire.
+            - Dérive rho et sigma (32 octets chacun) avec SHAKE-256.
+            - Construit la matrice A à partir de rho.
+            - Génère les vecteurs secrets s et e via cbd.
+            - Calcule t = A * s + e.
+            - Renvoie :
+                public_key = (t, rho)
+                secret_key = s
+
+        .prepare_public_key(public_key):
+            - Renvoie une PreparedPublicKey (à réutiliser pour chaque encaps).
+
+        .prepare_secret_key(secret_key):
+            - Renvoie une PreparedSecretKey (à réutiliser pour chaque decaps).
+
+        .encaps(public_key):
+            - Régénère A à partir de rho (cache), sauf si la clé est préparée.
+            - Génère de nouveaux bruits r, e1, e2.
+            - Calcule u = A^T * r + e1.
+            - Génère une graine mu_raw pour le secret partagé.
+            - Encode mu_raw dans un polynôme binaire mu_poly (coeffs 0 ou Q/2).
+            - Calcule v = t * r + e2 + mu_poly.
+            - Compresse u et v pour former le ciphertext.
+            - Dérive le secret partagé shared_secret = KDF(mu_raw).
+            - Renvoie (ciphertext, shared_secret).
+
+        .encaps_many(public_key, count, workers=None):
+        .decaps_many(secret_key, ciphertexts, workers=None):
+            - Versions par lots : un seul tirage d'aléa (os.urandom) pour tout
+              le lot, un seul passage vectorisé sur des tableaux (B, K, N) avec
+              le backend "numpy", et répartition optionnelle sur `workers`
+              processus.
+
+        .pack_public_key / pack_ciphertext / pack_secret_key (et unpack_*):
+            - Conversion vers / depuis le format binaire compact.
+            - encaps et decaps acceptent aussi directement ces bytes.
+
+        .decaps(ciphertext, secret_key):
+            - Décompresse u et v.
+            - Passe s en NTT, sauf si la clé est préparée.
+            - Calcule noisy_mu ≈ mu_poly + bruit via v - s * u.
+            - Ré-extrait les bits de mu en comparant les coeffs à 0 et Q/2.
+            - Reconstitue mu_raw à partir des bits.
+            - Re-dérive le même secret partagé via KDF(mu_raw).
+
+    - class KeypairPool(kyber, depth=16, workers=1, mode="thread", batch=4):
+        Réserve de paires de clés remplie en tâche de fond, pour sortir keygen
+        du chemin critique de la poignée de main :
+            - `workers` threads (mode="thread") ou processus (mode="process")
+              complètent la réserve jusqu'à `depth` paires, par lots de `batch` ;
+            - get() prend une paire dans la réserve (hit) ou, si elle est vide,
+              en génère une tout de suite (miss) : un appel n'attend jamais
+              plus qu'un keygen ;
+            - un remplissage qui échoue ne fait pas échouer get() : il est
+              compté (errors, last_error) et relancé après une attente
+              croissante ;
+            - stats() : hits, misses, taux de hit, profondeur courante, nombre
+              de remplissages, latence de keygen en tâche de fond et échecs.
+
+Limites :
+    - Sampling, compression, parsing, encodage du message : tout est simplifié.
+
+Utilisation rapide :
+    kyber = KyberImplementation()
+    pk, sk = kyber.keygen()
+    cipher, ss_alice = kyber.encaps(pk)
+    ss_bob = kyber.decaps(cipher, sk)
+    print(ss_alice == ss_bob)  # Doit être True si tout va bien.
+
+    # Format binaire : 800 / 768 octets
+    pk_bytes = kyber.pack_public_key(pk)
+    cipher, ss = kyber.encaps(pk_bytes)
+    wire = kyber.pack_ciphertext(cipher)
+    assert kyber.decaps(wire, sk) == ss
+
+    # Serveur qui encapsule souvent vers la même clé publique
+    prepared = kyber.prepare_public_key(pk)
+    cipher, ss = kyber.encaps(prepared)
+
+    # ... et qui décapsule souvent sous la même clé secrète
+    prepared_sk = kyber.prepare_secret_key(sk)
+    assert kyber.decaps(cipher, prepared_sk) == ss
+
+    # Rafale de sessions
+    results = kyber.encaps_many(pk, 1000)
+    secrets = kyber.decaps_many(sk, [ct for ct, _ in results])
+
+    # Autres jeux de paramètres, dans le même processus
+    kyber768 = KyberImplementation(params="Kyber-768")
+
+    # Clés éphémères pré-générées en tâche de fond
+    with KeypairPool(kyber, depth=32, workers=2) as pool:
+        pk, sk = pool.get()      # immédiat si la réserve n'est pas vide
+        print(pool.stats())      # hits, misses, latence de remplissage, ...
+
+Vérification et mesures (rien ne s'exécute à l'import) :
+    python -m post_quantum.kyber   # démo, NTT vs naïf, poignées de main / s, jeux
+"""
+import os
+import hashlib
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+from math import lcm
+import random
+import time
+
+
+N = 256
+Q = 3329
+MATRIX_CACHE_SIZE = 128  # nombre de matrices A (une par (rho, K)) gardées en cache
+POLY_BYTES = 384  # polynôme sur 12 bits
+
+# --- NTT (q = 3329, N = 256) ---
+ZETA = 17  # racine primitive 256-ième de l'unité modulo Q
+
+
+def _bitrev7(x):
+    return int(f"{x:07b}"[::-1], 2)
+
+
+# ZETAS[i] = 17^bitrev7(i) : facteurs des papillons, dans l'ordre de parcours
+ZETAS = [pow(ZETA, _bitrev7(i), Q) for i in range(128)]
+# GAMMAS[i] = 17^(2*bitrev7(i)+1) : X^2 - gamma_i, facteurs de X^256 + 1
+GAMMAS = [pow(ZETA, 2 * _bitrev7(i) + 1, Q) for i in range(128)]
+N_INV = pow(128, -1, Q)  # normalisation de la NTT inverse (7 niveaux)
+
+
+def ntt(coeffs):
+    """NTT de Kyber (Cooley-Tukey), renvoie une nouvelle liste"""
+    f = list(coeffs)
+    k = 1
+    length = 128
+    while length >= 2:
+        for start in range(0, N, 2 * length):
+            zeta = ZETAS[k]
+            k += 1
+            for j in range(start, start + length):
+                t = zeta * f[j + length] % Q
+                f[j + length] = (f[j] - t) % Q
+                f[j] = (f[j] + t) % Q
+        length //= 2
+    return f
+
+
+def intt(coeffs):
+    """NTT inverse (Gentleman-Sande), normalisée par 128^-1"""
+    f = list(coeffs)
+    k = 127
+    length = 2
+    while length <= 128:
+        for start in range(0, N, 2 * length):
+            zeta = ZETAS[k]
+            k -= 1
+            for j in range(start, start + length):
+                t = f[j]
+                f[j] = (t + f[j + length]) % Q
+                f[j + length] = zeta * (f[j + length] - t) % Q
+        length *= 2
+    return [x * N_INV % Q for x in f]
+
+
+def basemul(a, b):
+    """Produit de deux polynômes en forme NTT (128 produits de degré 1 mod X^2 - gamma)"""
+    out = [0] * N
+    for i in range(128):
+        a0, a1 = a[2 * i], a[2 * i + 1]
+        b0, b1 = b[2 * i], b[2 * i + 1]
+        out[2 * i] = (a0 * b0 + a1 * b1 % Q * GAMMAS[i]) % Q
+        out[2 * i + 1] = (a0 * b1 + a1 * b0) % Q
+    return out
+
+
+# --- Tables de compression (une par nombre de bits d, partagées) ---
+@lru_cache(maxsize=None)
+def _compress_table(d):
+    """c -> round(c * 2^d / Q) mod 2^d, pour c dans [0, Q)"""
+    half = Q // 2
+    mask = (1 << d) - 1
+    return tuple(((c << d) + half) // Q & mask for c in range(Q))
+
+
+@lru_cache(maxsize=None)
+def _decompress_table(d):
+    """c -> round(c * Q / 2^d) (égalités arrondies vers le haut), pour c dans [0, 2^d)"""
+    half = 1 << (d - 1)
+    return tuple((c * Q + half) >> d for c in range(1 << d))
+
+
+class Polynomial:
+    def __init__(self, coeffs=None):
+        if coeffs is None:
+            self.coeffs = [0] * N
+        else:
+            self.coeffs = coeffs
+            # Reduction modulo X^N + 1
+            self.reduce()
+
+    def reduce(self):
+        """Applique modulo Q et modulo X^N + 1"""
+        # Simplification: on suppose ici que l'entrée ne dépasse pas 2*N
+        # Dans une implémentation NTT réelle, c'est différent.
+        for i in range(len(self.coeffs)):
+            self.coeffs[i] %= Q
+        while len(self.coeffs) > N:
+            val = self.coeffs.pop()
+            idx = len(self.coeffs) - N
+            self.coeffs[idx] = (self.coeffs[idx] - val) % Q
+
+    def __add__(self, other):
+        new_coeffs = [(a + b) % Q for a, b in zip(self.coeffs, other.coeffs)]
+        return Polynomial(new_coeffs)
+
+    def __sub__(self, other):
+        new_coeffs = [(a - b) % Q for a, b in zip(self.coeffs, other.coeffs)]
+        return Polynomial(new_coeffs)
+
+    def __mul__(self, other):
+        # Multiplication par NTT : O(N log N) au lieu de O(N^2)
+        return Polynomial(intt(basemul(ntt(self.coeffs), ntt(other.coeffs))))
+
+    def mul_naive(self, other):
+        # Multiplication naïve O(N^2), gardée comme référence
+        res = [0] * (2 * N)
+        for i in range(N):
+            for j in range(N):
+                res[i + j] = (res[i + j] + self.coeffs[i] * other.coeffs[j])
+        
+        # Reduction X^N = -1 mod Q
+        # ex: x^256 -> -1, x^257 -> -x
+        final = [0] * N
+        for i in range(2 * N):
+            if i < N:
+                final[i] = (final[i] + res[i]) % Q
+            else:
+                final[i - N] = (final[i - N] - res[i]) % Q
+        return Polynomial(final)
+
+    def compress(self, d, table=None):
+        """Compression des coefficients (perte d'information contrôlée)"""
+        # round(c * 2^d / Q), lu dans une table précalculée (celle du jeu de paramètres)
+        if table is None:
+            table = _compress_table(d)
+        return [table[c] for c in self.coeffs]
+
+    @staticmethod
+    def decompress(compressed_coeffs, d, table=None):
+        # round(c * Q / 2^d), lu dans une table précalculée
+        if table is None:
+            table = _decompress_table(d)
+        new_coeffs = [table[c] for c in compressed_coeffs]
+        return Polynomial(new_coeffs)
+
+    def to_bytes(self):
+        b = bytearray()
+        for c in self.coeffs:
+            b.extend(c.to_bytes(2, 'big'))
+        return bytes(b)
+
+    def encode(self, d=12):
+        """Coefficients empaquetés sur d bits (32*d octets)"""
+        return byte_encode(self.coeffs, d)
+
+    @staticmethod
+    def decode(data, d=12):
+        return Polynomial(byte_decode(data, d))
+
+# --- Sérialisation compacte (ByteEncode / ByteDecode) ---
+def _word(d):
+    """(octets, coefficients) d'un groupe : lcm(d, 8) bits"""
+    bits = lcm(d, 8)
+    return bits // 8, bits // d
+
+
+def byte_encode(coeffs, d):
+    """Coefficients de d bits -> bytes (bits poids faible d'abord)"""
+    word, per = _word(d)
+    out = bytearray()
+    for i in range(0, len(coeffs), per):
+        w = 0
+        for c in reversed(coeffs[i : i + per]):
+            w = w << d | c
+        out += w.to_bytes(word, 'little')
+    return bytes(out)
+
+
+def byte_decode(data, d):
+    """bytes -> coefficients de d bits ; `data` peut être un memoryview (pas de copie)"""
+    view = memoryview(data)
+    word, per = _word(d)
+    mask = (1 << d) - 1
+    out = []
+    for i in range(0, len(view), word):
+        w = int.from_bytes(view[i : i + word], 'little')
+        for _ in range(per):
+            out.append(w & mask)
+            w >>= d
+    return out
+
+
+def pack_polys(polys, d):
+    """Suite de polynômes (Polynomial, listes de coefficients ou tableau (..., N)) -> bytes"""
+    if isinstance(polys, PolyArray):
+        polys = polys.data
+    if _is_array(polys):
+        return byte_encode_array(polys, d)
+    return b"".join(byte_encode(getattr(p, "coeffs", p), d) for p in polys)
+
+
+def unpack_polys(data, d, as_array=False):
+    """bytes -> liste de listes de coefficients (ou tableau (m, N))"""
+    if as_array:
+        return byte_decode_array(data, d)
+    view = memoryview(data)
+    size = 32 * d
+    return [byte_decode(view[i : i + size], d) for i in range(0, len(view), size)]
+
+
+def _is_bytes(x):
+    return isinstance(x, (bytes, bytearray, memoryview))
+
+
+# --- Backend NumPy (optionnel) ---
+# Polynômes et vecteurs / matrices de polynômes stockés comme tableaux (..., N) :
+# un polynôme est de forme (N,), un vecteur (K, N), la matrice A (K, K, N).
+# Toutes les opérations sont vectorisées sur les axes de tête.
+_np = False  # False = pas encore essayé, None = absent
+_np_tables = None
+
+
+def _numpy():
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np = numpy
+    return _np
+
+
+def _require_numpy():
+    np = _numpy()
+    if np is None:
+        raise ImportError("Le backend 'numpy' nécessite NumPy (pip install numpy)")
+    return np
+
+
+@lru_cache(maxsize=None)
+def _table_array(kind, d):
+    """Tables de compression / décompression en tableaux NumPy"""
+    np = _require_numpy()
+    if kind == "compress":
+        return np.array(_compress_table(d), dtype=np.uint16)
+    return np.array(_decompress_table(d), dtype=np.int64)
+
+
+def _is_array(x):
+    return bool(_np) and isinstance(x, _np.ndarray)
+
+
+def _tables():
+    """Tables de la NTT en tableaux NumPy (construites au premier appel)"""
+    global _np_tables
+    if _np_tables is None:
+        np = _require_numpy()
+        _np_tables = (np.array(ZETAS, dtype=np.int64), np.array(GAMMAS, dtype=np.int64))
+    return _np_tables
+
+
+def ntt_array(a):
+    """NTT sur le dernier axe d'un tableau (..., N) ; renvoie un tableau int64"""
+    np = _require_numpy()
+    zetas, _ = _tables()
+    f = np.array(a, dtype=np.int64)
+    shape = f.shape
+    k = 1
+    length = 128
+    while length >= 2:
+        blocks = N // (2 * length)
+        z = zetas[k : k + blocks, None]
+        k += blocks
+        f = f.reshape(shape[:-1] + (blocks, 2, length))
+        lo, hi = f[..., 0, :], f[..., 1, :]
+        t = hi * z % Q
+        f = np.stack(((lo + t) % Q, (lo - t) % Q), axis=-2)
+        length //= 2
+    return f.reshape(shape)
+
+
+def intt_array(a):
+    """NTT inverse sur le dernier axe d'un tableau (..., N)"""
+    np = _require_numpy()
+    zetas, _ = _tables()
+    f = np.array(a, dtype=np.int64)
+    shape = f.shape
+    k = 127
+    length = 2
+    while length <= 128:
+        blocks = N // (2 * length)
+        z = zetas[k - blocks + 1 : k + 1][::-1, None]
+        k -= blocks
+        f = f.reshape(shape[:-1] + (blocks, 2, length))
+        lo, hi = f[..., 0, :], f[..., 1, :]
+        f = np.stack(((lo + hi) % Q, (hi - lo) * z % Q), axis=-2)
+        length *= 2
+    return f.reshape(shape) * N_INV % Q
+
+
+def basemul_array(a, b):
+    """basemul vectorisé (forme NTT, diffusion sur les axes de tête), non réduit"""
+    np = _require_numpy()
+    _, gammas = _tables()
+    a0, a1 = a[..., 0::2], a[..., 1::2]
+    b0, b1 = b[..., 0::2], b[..., 1::2]
+    c0 = a0 * b0 + a1 * b1 % Q * gammas
+    c1 = a0 * b1 + a1 * b0
+    out = np.stack((c0, c1), axis=-1)
+    return out.reshape(out.shape[:-2] + (N,))
+
+
+class PolyArray:
+    """Polynôme (N,) ou vecteur / matrice de polynômes (..., N), coefficients int32 mod Q"""
+
+    def __init__(self, data):
+        np = _require_numpy()
+        self.data = (np.asarray(data, dtype=np.int64) % Q).astype(np.int32)
+
+    @classmethod
+    def from_polys(cls, polys):
+        """Depuis un Polynomial, une liste (vecteur) ou une liste de listes (matrice)"""
+        if isinstance(polys, PolyArray):
+            return polys
+        if isinstance(polys, Polynomial):
+            return cls(polys.coeffs)
+        if isinstance(polys[0], Polynomial):
+            return cls([p.coeffs for p in polys])
+        return cls([[p.coeffs for p in row] for row in polys])
+
+    def to_polys(self):
+        if self.data.ndim == 1:
+            return Polynomial(self.data.tolist())
+        return [PolyArray(row).to_polys() for row in self.data]
+
+    @property
+    def coeffs(self):
+        return self.data.tolist()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        return PolyArray(self.data[i])
+
+    def __add__(self, other):
+        return PolyArray(self.data.astype(_np.int64) + other.data)
+
+    def __sub__(self, other):
+        return PolyArray(self.data.astype(_np.int64) - other.data)
+
+    def __mul__(self, other):
+        # Produit polynôme par polynôme (terme à terme sur les axes de tête)
+        return PolyArray(intt_array(basemul_array(ntt_array(self.data), ntt_array(other.data)) % Q))
+
+    def matvec(self, v, transpose=False):
+        """A * v (ou A^T * v) pour A de forme (K, K, N) et v de forme (..., K, N)"""
+        return mat_vec_ntt(ntt_array(self.data), ntt_array(v.data), transpose)
+
+    def dot(self, other):
+        """Produit scalaire de deux vecteurs (..., K, N) -> polynôme (..., N)"""
+        prod = basemul_array(ntt_array(self.data), ntt_array(other.data))
+        return PolyArray(intt_array(prod.sum(axis=-2) % Q))
+
+    def compress(self, d, table=None):
+        if table is None:
+            table = _table_array("compress", d)
+        return table[self.data]
+
+    @staticmethod
+    def decompress(compressed, d, table=None):
+        np = _require_numpy()
+        if table is None:
+            table = _table_array("decompress", d)
+        return PolyArray(table[np.asarray(compressed, dtype=np.intp)])
+
+    def to_bytes(self):
+        return self.data.astype(">u2").tobytes()
+
+    def encode(self, d=12):
+        return byte_encode_array(self.data, d)
+
+
+def byte_encode_array(values, d):
+    """byte_encode vectorisé : tableau (..., N) -> bytes (polynômes mis bout à bout)"""
+    np = _require_numpy()
+    v = np.asarray(values, dtype=np.uint16)
+    bits = (v[..., None] >> np.arange(d, dtype=np.uint16)) & 1
+    return np.packbits(bits.astype(np.uint8).reshape(-1), bitorder="little").tobytes()
+
+
+def byte_decode_array(data, d):
+    """byte_decode vectorisé : bytes / memoryview -> tableau (m, N), sans copie de l'entrée"""
+    np = _require_numpy()
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+    return bits.reshape(-1, N, d).astype(np.int64) @ (1 << np.arange(d, dtype=np.int64))
+
+
+# --- Vecteurs de polynômes (PolyVec ou PolyArray) ---
+class PolyVec:
+    """Vecteur de polynômes : liste de K listes de coefficients mod Q"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def from_polys(cls, polys):
+        if isinstance(polys, PolyVec):
+            return polys
+        return cls([list(getattr(p, "coeffs", p)) for p in polys])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        return Polynomial(list(self.rows[i]))
+
+    def __iter__(self):
+        return (Polynomial(list(row)) for row in self.rows)
+
+    def __add__(self, other):
+        return PolyVec([[(x + y) % Q for x, y in zip(a, b)] for a, b in zip(self.rows, other.rows)])
+
+    def __sub__(self, other):
+        return PolyVec([[(x - y) % Q for x, y in zip(a, b)] for a, b in zip(self.rows, other.rows)])
+
+    def ntt(self):
+        return [ntt(row) for row in self.rows]
+
+    def compress(self, d, table=None):
+        if table is None:
+            table = _compress_table(d)
+        return [[table[c] for c in row] for row in self.rows]
+
+    @staticmethod
+    def decompress(rows, d, table=None):
+        if table is None:
+            table = _decompress_table(d)
+        return PolyVec([[table[c] for c in row] for row in rows])
+
+
+def vec_ntt(v):
+    """Vecteur de polynômes -> forme NTT (liste de listes, ou tableau (..., K, N))"""
+    if isinstance(v, PolyArray):
+        return ntt_array(v.data)
+    if isinstance(v, PolyVec):
+        return v.ntt()
+    return [ntt(p.coeffs) for p in v]
+
+
+def _ntt_inner(a_hats, b_hats):
+    """
+    Somme des produits point à point de polynômes en forme NTT.
+    Les produits sont accumulés sans réduction (entiers Python) et réduits une
+    seule fois à la fin. Pas de réduction de Barrett : en CPython comme en
+    NumPy, un `% Q` final coûte moins cher.
+    """
+    pairs = list(zip(a_hats, b_hats))
+    out = [0] * N
+    for i in range(128):
+        e, o = 2 * i, 2 * i + 1
+        g = GAMMAS[i]
+        c0 = c1 = 0
+        for a, b in pairs:
+            a0, a1, b0, b1 = a[e], a[o], b[e], b[o]
+            c0 += a0 * b0 + a1 * b1 * g
+            c1 += a0 * b1 + a1 * b0
+        out[e] = c0 % Q
+        out[o] = c1 % Q
+    return out
+
+
+def mat_vec_ntt(a_hat, v_hat, transpose=False):
+    """A * v (ou A^T * v) à partir des formes NTT de A et v ; résultat hors NTT"""
+    if _is_array(a_hat):
+        if transpose:
+            a_hat = a_hat.swapaxes(-3, -2)
+        # Somme des K produits puis une seule réduction
+        prod = basemul_array(a_hat, v_hat[..., None, :, :])
+        return PolyArray(intt_array(prod.sum(axis=-2) % Q))
+    k = len(a_hat)
+    out = []
+    for i in range(k):
+        # A_transpose[i][j] = A[j][i]
+        row = [a_hat[j][i] if transpose else a_hat[i][j] for j in range(k)]
+        out.append(intt(_ntt_inner(row, v_hat)))
+    return PolyVec(out)
+
+
+def inner_ntt(a_hat, b_hat):
+    """a^T * b à partir des formes NTT ; résultat hors NTT"""
+    if _is_array(a_hat):
+        return PolyArray(intt_array(basemul_array(a_hat, b_hat).sum(axis=-2) % Q))
+    return Polynomial(intt(_ntt_inner(a_hat, b_hat)))
+
+
+def inner(a, b):
+    """Produit scalaire a^T * b de deux vecteurs de polynômes"""
+    if isinstance(a, PolyArray):
+        return a.dot(b)
+    return inner_ntt(vec_ntt(a), vec_ntt(b))
+
+
+def encode_message(mu_raw, as_array=False):
+    """Bits de mu (poids faible d'abord) -> coefficients 0 ou Q/2"""
+    mu_bits = int.from_bytes(mu_raw, 'big')
+    coeffs = [Q // 2 if (mu_bits >> i) & 1 else 0 for i in range(N)]
+    return PolyArray(coeffs) if as_array else Polynomial(coeffs)
+
+
+def decode_message(noisy_mu):
+    """Arrondi de chaque coefficient vers 0 ou Q/2 -> 32 octets"""
+    if isinstance(noisy_mu, PolyArray):
+        return _decode_messages_array(noisy_mu.data[None])[0].tobytes()
+    rec_int = 0
+    for i, coeff in enumerate(noisy_mu.coeffs):
+        # Si le coeff est proche de Q/2, c'est un 1. Sinon 0.
+        dist_half = abs(coeff - (Q // 2))
+        dist_0 = min(coeff, Q - coeff)
+        if dist_half < dist_0:
+            rec_int |= (1 << i)
+    return rec_int.to_bytes(32, 'big')
+
+
+def _encode_messages_array(mu):
+    """encode_message par lots : tableau (B, 32) d'octets -> coefficients (B, N)"""
+    np = _np
+    # bit i de int.from_bytes(mu, 'big') = bit i % 8 de l'octet 31 - i // 8
+    bits = np.unpackbits(mu[:, ::-1], axis=1, bitorder="little")
+    return bits.astype(np.int64) * (Q // 2)
+
+
+def _decode_messages_array(c):
+    """decode_message par lots : coefficients (B, N) -> tableau (B, 32) d'octets"""
+    np = _np
+    c = c.astype(np.int64)
+    bits = np.abs(c - Q // 2) < np.minimum(c, Q - c)
+    return np.packbits(bits, axis=1, bitorder="little")[:, ::-1]
+
+
+@lru_cache(maxsize=None)
+def _cbd_values(eta):
+    """Valeur de 2*eta bits -> coefficient (somme des eta bits bas - somme des eta bits hauts)"""
+    low = (1 << eta) - 1
+    return tuple(
+        ((v & low).bit_count() - (v >> eta).bit_count()) % Q for v in range(1 << (2 * eta))
+    )
+
+
+@lru_cache(maxsize=None)
+def _cbd_byte_table(eta):
+    """Octet -> coefficients qu'il contient (quand 2*eta divise 8)"""
+    values = _cbd_values(eta)
+    width = 2 * eta
+    mask = (1 << width) - 1
+    return tuple(
+        tuple(values[(b >> shift) & mask] for shift in range(0, 8, width)) for b in range(256)
+    )
+
+
+def _cbd_table(eta):
+    """Table lue par cbd : octet -> coefficients, ou valeur de 2*eta bits -> coefficient"""
+    if 8 % (2 * eta) == 0:
+        return _cbd_byte_table(eta)
+    return _cbd_values(eta)
+
+
+def cbd(buffer, eta, table=None):
+    """Centered Binomial Distribution: génère du bruit déterministe"""
+    # Convertit 64*eta octets aléatoires en coefficients de polynôme petits
+    size = 64 * eta
+    if len(buffer) < size:
+        raise ValueError(f"cbd: {size} octets requis pour eta={eta}")
+    if table is None:
+        table = _cbd_table(eta)
+    width = 2 * eta
+    if 8 % width == 0:
+        # eta = 1, 2, 4 : chaque octet donne 8 / (2*eta) coefficients
+        coeffs = list(chain.from_iterable(map(table.__getitem__, buffer[:size])))
+    else:
+        # eta = 3 : mots de 3 octets (4 coefficients de 6 bits)
+        values = table
+        word = lcm(width, 8) // 8
+        mask = (1 << width) - 1
+        coeffs = []
+        for i in range(0, size, word):
+            w = int.from_bytes(buffer[i : i + word], 'little')
+            for _ in range(word * 8 // width):
+                coeffs.append(values[w & mask])
+                w >>= width
+    return Polynomial(coeffs)
+
+
+def cbd_array(buffer, eta):
+    """cbd vectorisé : 64*eta*m octets -> PolyArray de forme (m, N)"""
+    np = _require_numpy()
+    bits = np.unpackbits(np.frombuffer(buffer, dtype=np.uint8), bitorder="little")
+    bits = bits.reshape(-1, N, 2, eta).sum(axis=-1, dtype=np.int64)
+    return PolyArray(bits[..., 0] - bits[..., 1])
+
+
+def sample_ntt(rho, i, j):
+    """Polynôme uniforme mod Q (forme NTT) tiré par rejet dans SHAKE-128(rho || j || i)"""
+    xof = hashlib.shake_128(rho + bytes([j, i]))
+    coeffs = []
+    size = 504  # 3 blocs SHAKE-128, suffisent presque toujours
+    pos = 0
+    while True:
+        # hashlib ne sait pas prolonger la sortie : on relit un préfixe plus long
+        buf = xof.digest(size)
+        for k in range(pos, size - 2, 3):
+            d1 = buf[k] | (buf[k + 1] & 0x0F) << 8
+            d2 = buf[k + 1] >> 4 | buf[k + 2] << 4
+            if d1 < Q:
+                coeffs.append(d1)
+            if d2 < Q and len(coeffs) < N:
+                coeffs.append(d2)
+            if len(coeffs) >= N:
+                return coeffs[:N]
+        pos = size
+        size += 168
+
+
+def parse(rho, k=2):
+    """Transforme le flux XOF en une matrice A (Uniform Sampling) k x k, en forme NTT"""
+    return [[sample_ntt(rho, i, j) for j in range(k)] for i in range(k)]
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def expand_matrix(rho, k=2):
+    """Matrice A dérivée de rho, en forme NTT (tuples k x k), mise en cache par (rho, k)"""
+    return tuple(tuple(tuple(row_poly) for row_poly in row) for row in parse(rho, k))
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def expand_matrix_array(rho, k=2):
+    """Comme expand_matrix, en tableau NumPy (k, k, N) en lecture seule"""
+    np = _require_numpy()
+    a_hat = np.array(expand_matrix(rho, k), dtype=np.int64)
+    a_hat.flags.writeable = False
+    return a_hat
+
+
+class KyberParams:
+    """Jeu de paramètres Kyber ; ses tables sont construites une fois et partagées"""
+
+    def __init__(self, name, k, eta1, eta2, du, dv):
+        self.name = name
+        self.k = k
+        self.eta1 = eta1  # bruit de s, e (keygen) et r (encaps)
+        self.eta2 = eta2  # bruit de e1, e2 (encaps)
+        self.du = du      # bits par coefficient de u dans le chiffré
+        self.dv = dv      # bits par coefficient de v
+        self.public_key_size = POLY_BYTES * k + 32
+        self.secret_key_size = POLY_BYTES * k
+        self.ciphertext_size = 32 * (du * k + dv)
+        # Aléa d'une encapsulation : r (k polynômes, eta1), e1 (k, eta2), e2 (eta2), mu
+        self.noise1_bytes = 64 * eta1
+        self.noise2_bytes = 64 * eta2
+        self.coins_size = self.noise1_bytes * k + self.noise2_bytes * (k + 1) + 32
+        # Tables lues par KyberImplementation, remplies par load_tables() :
+        # d -> table de (dé)compression, eta -> table de cbd
+        self.compress_tables = None
+        self.decompress_tables = None
+        self.cbd_tables = None
+        self.array_tables = None   # (kind, d) -> tableau NumPy, backend "numpy"
+
+    def load_tables(self, backend="python"):
+        """Construit les tables du jeu (une fois ; caches partagés par d et par eta)"""
+        d_values = (self.du, self.dv)
+        if self.compress_tables is None:
+            self.decompress_tables = {d: _decompress_table(d) for d in d_values}
+            self.cbd_tables = {eta: _cbd_table(eta) for eta in (self.eta1, self.eta2)}
+            self.compress_tables = {d: _compress_table(d) for d in d_values}
+        if backend == "numpy" and self.array_tables is None:
+            self.array_tables = {
+                (kind, d): _table_array(kind, d)
+                for kind in ("compress", "decompress")
+                for d in d_values
+            }
+        return self
+
+    def __repr__(self):
+        return f"KyberParams({self.name!r})"
+
+
+KYBER512 = KyberParams("Kyber-512", k=2, eta1=3, eta2=2, du=10, dv=4)
+KYBER768 = KyberParams("Kyber-768", k=3, eta1=2, eta2=2, du=10, dv=4)
+KYBER1024 = KyberParams("Kyber-1024", k=4, eta1=2, eta2=2, du=11, dv=5)
+PARAMETER_SETS = {p.name: p for p in (KYBER512, KYBER768, KYBER1024)}
+
+
+class PreparedPublicKey:
+    """Clé publique avec A et t en forme NTT, pour des encapsulations répétées"""
+
+    def __init__(self, public_key, backend="python"):
+        t, rho = public_key
+        self.public_key = public_key
+        self.backend = backend
+        if backend == "numpy":
+            self.a_hat = expand_matrix_array(rho, len(t))
+            self.t_hat = ntt_array(PolyArray.from_polys(t).data)
+        else:
+            self.a_hat = expand_matrix(rho, len(t))
+            self.t_hat = vec_ntt(t)
+
+
+class PreparedSecretKey:
+    """Clé secrète avec s en forme NTT, pour des décapsulations répétées"""
+
+    def __init__(self, secret_key, backend="python"):
+        self.secret_key = secret_key
+        self.backend = backend
+        if backend == "numpy":
+            self.s_hat = ntt_array(PolyArray.from_polys(secret_key).data)
+        else:
+            self.s_hat = vec_ntt(PolyVec.from_polys(secret_key))
+
+
+class KyberImplementation:
+    def __init__(self, backend="python", params=KYBER512):
+        """
+        backend : "python" (listes de Polynomial) ou "numpy" (tableaux (K, N))
+        params  : KyberParams ou son nom ("Kyber-512", "Kyber-768", "Kyber-1024")
+        """
+        if backend not in ("python", "numpy"):
+            raise ValueError(f"Backend inconnu: {backend}")
+        if backend == "numpy":
+            _require_numpy()
+        if isinstance(params, str):
+            try:
+                params = PARAMETER_SETS[params]
+            except KeyError:
+                raise ValueError(f"Jeu de paramètres inconnu: {params}") from None
+        self.backend = backend
+        self.params = params.load_tables(backend)   # au premier usage du jeu, pas à l'import
+
+    def _vec(self, polys):
+        if self.backend == "numpy":
+            return PolyArray.from_polys(polys)
+        return PolyVec.from_polys(polys)
+
+    def _noise(self, count, eta, buffer=None):
+        """`count` polynômes de bruit CBD, tirés de `buffer` ou d'un seul appel à os.urandom"""
+        step = 64 * eta
+        if buffer is None:
+            buffer = os.urandom(step * count)
+        if self.backend == "numpy":
+            return cbd_array(buffer, eta)
+        table = self.params.cbd_tables[eta]
+        return PolyVec(
+            [cbd(buffer[i : i + step], eta, table).coeffs for i in range(0, len(buffer), step)]
+        )
+
+    def _matrix(self, rho):
+        if self.backend == "numpy":
+            return expand_matrix_array(rho, self.params.k)
+        return expand_matrix(rho, self.params.k)
+
+    def prepare_public_key(self, public_key):
+        """Développe A et passe t en NTT une fois pour toutes"""
+        if _is_bytes(public_key):
+            public_key = self.unpack_public_key(public_key)
+        return PreparedPublicKey(public_key, self.backend)
+
+    def prepare_secret_key(self, secret_key):
+        """Passe s en NTT une fois pour toutes"""
+        if _is_bytes(secret_key):
+            secret_key = self.unpack_secret_key(secret_key)
+        return PreparedSecretKey(secret_key, self.backend)
+
+    def _prepared_public(self, public_key):
+        if isinstance(public_key, PreparedPublicKey):
+            if public_key.backend == self.backend:
+                return public_key
+            public_key = public_key.public_key
+        return self.prepare_public_key(public_key) # Régénération de A (cache)
+
+    def _prepared_secret(self, secret_key):
+        if isinstance(secret_key, PreparedSecretKey):
+            if secret_key.backend == self.backend:
+                return secret_key
+            secret_key = secret_key.secret_key
+        return self.prepare_secret_key(secret_key) # NTT de s
+
+    # --- Format binaire ---
+    def pack_public_key(self, public_key):
+        """(t, rho) -> t sur 12 bits || rho"""
+        if isinstance(public_key, PreparedPublicKey):
+            public_key = public_key.public_key
+        t, rho = public_key
+        return pack_polys(t, 12) + rho
+
+    def unpack_public_key(self, data):
+        view = memoryview(data)
+        size = self.params.public_key_size
+        if len(view) != size:
+            raise ValueError(f"Clé publique de {size} octets attendue, reçu {len(view)}")
+        split = POLY_BYTES * self.params.k
+        return self._unpack_vec(view[:split], 12), bytes(view[split:])
+
+    def pack_secret_key(self, secret_key):
+        if isinstance(secret_key, PreparedSecretKey):
+            secret_key = secret_key.secret_key
+        return pack_polys(secret_key, 12)
+
+    def unpack_secret_key(self, data):
+        view = memoryview(data)
+        size = self.params.secret_key_size
+        if len(view) != size:
+            raise ValueError(f"Clé secrète de {size} octets attendue, reçu {len(view)}")
+        return self._unpack_vec(view, 12)
+
+    def pack_ciphertext(self, ciphertext):
+        """(c_u, c_v) -> u sur du bits || v sur dv bits"""
+        c_u, c_v = ciphertext
+        p = self.params
+        return pack_polys(c_u, p.du) + pack_polys([c_v] if isinstance(c_v, list) else c_v, p.dv)
+
+    def unpack_ciphertext(self, data):
+        view = memoryview(data)
+        p = self.params
+        if len(view) != p.ciphertext_size:
+            raise ValueError(f"Chiffré de {p.ciphertext_size} octets attendu, reçu {len(view)}")
+        split = 32 * p.du * p.k
+        as_array = self.backend == "numpy"
+        c_u = unpack_polys(view[:split], p.du, as_array)
+        c_v = unpack_polys(view[split:], p.dv, as_array)[0]
+        return c_u, c_v
+
+    def _unpack_vec(self, view, d):
+        if self.backend == "numpy":
+            return PolyArray(byte_decode_array(view, d))
+        return PolyVec([[c % Q for c in row] for row in unpack_polys(view, d)])
+
+    def keygen(self):
+        """Génération de clés (Public Key, Secret Key)"""
+        #Graine aléatoire
+        seed = os.urandom(32)
+        
+        #Expansion de la graine
+        # On dérive rho (pour A) et sigma (pour le bruit s et e)
+        h = hashlib.shake_256(seed).digest(64)
+        rho, sigma = h[:32], h[32:]
+        
+        #Génération de la matrice A (Public)  
+        # Matrice K x K, en forme NTT (gardée en cache pour les encaps suivants)
+        a_hat = self._matrix(rho)
+        
+        #Génération des vecteurs secrets s et erreur e (Bruit)
+        # s et e sont tirés de la distribution binomiale centrée
+        s = self._noise(self.params.k, self.params.eta1)
+        e = self._noise(self.params.k, self.params.eta1)
+        
+        #Calcul de t = A * s + e
+        t = mat_vec_ntt(a_hat, vec_ntt(s)) + e
+            
+        public_key = (t, rho) # t est le vecteur public, rho régénère A
+        secret_key = s        # s est le vecteur secret
+        return public_key, secret_key
+
+    def encaps(self, public_key):
+        """Encapsulation: Crée un secret partagé et un chiffré"""
+        public_key = self._prepared_public(public_key)
+        coins = os.urandom(self.params.coins_size)
+        if self.backend == "numpy":
+            return self._encaps_array(public_key, coins)[0]
+        return self._encaps(public_key, coins)
+
+    def _encaps(self, public_key, coins):
+        """Encapsulation (backend python) avec l'aléa `coins` (params.coins_size octets)"""
+        p = self.params
+        split = p.noise1_bytes * p.k
+        #Nouveau bruit pour l'encapsulation
+        r = self._noise(p.k, p.eta1, coins[:split])
+        noise2 = self._noise(p.k + 1, p.eta2, coins[split:-32]).rows
+        e1, e2 = PolyVec(noise2[: p.k]), Polynomial(noise2[p.k])
+        
+        #Calcul du vecteur u = A_transpose * r + e1
+        r_hat = vec_ntt(r)
+        u = mat_vec_ntt(public_key.a_hat, r_hat, transpose=True) + e1
+            
+        #Calcul du polynôme v = t * r + e2 + message_encodé
+        # Ici le message est la graine du secret partagé
+        mu_raw = coins[-32:] #seed
+        
+        # Conversion des bits de mu en coefficients (0 ou Q/2)
+        mu_poly = encode_message(mu_raw)
+        
+        # v = t_transpose * r + e2 + mu
+        v = inner_ntt(public_key.t_hat, r_hat) + e2 + mu_poly
+        
+        #Compression (Ciphertext)
+        # On compresse u et v pour réduire la taille
+        c_u = u.compress(p.du, p.compress_tables[p.du])
+        c_v = v.compress(p.dv, p.compress_tables[p.dv])
+        ciphertext = (c_u, c_v)
+        
+        #Dérivation du secret (KDF sur mu)
+        shared_secret = hashlib.sha3_256(mu_raw).digest()
+        
+        return ciphertext, shared_secret
+
+    def _encaps_array(self, public_key, coins):
+        """Encapsulations (backend numpy) d'un lot : `coins` = B * params.coins_size octets"""
+        np = _np
+        p = self.params
+        count = len(coins) // p.coins_size
+        coins = np.frombuffer(coins, dtype=np.uint8).reshape(count, p.coins_size)
+        # Bruits du lot entier : r, e1 (B, K, N), e2 (B, N)
+        split = p.noise1_bytes * p.k
+        r = cbd_array(coins[:, :split].tobytes(), p.eta1).data.reshape(count, p.k, N)
+        noise2 = cbd_array(coins[:, split:-32].tobytes(), p.eta2).data
+        noise2 = noise2.reshape(count, p.k + 1, N)
+        e1, e2 = noise2[:, : p.k], noise2[:, p.k]
+        mu = coins[:, -32:]
+        
+        # u = A^T * r + e1 et v = t * r + e2 + mu, pour tout le lot
+        r_hat = ntt_array(r)
+        u = mat_vec_ntt(public_key.a_hat, r_hat, transpose=True) + PolyArray(e1)
+        v = inner_ntt(public_key.t_hat, r_hat) + PolyArray(e2 + _encode_messages_array(mu))
+        c_u = u.compress(p.du, p.array_tables["compress", p.du])   # (B, K, N)
+        c_v = v.compress(p.dv, p.array_tables["compress", p.dv])   # (B, N)
+        return [
+            ((c_u[i], c_v[i]), hashlib.sha3_256(mu[i].tobytes()).digest()) for i in range(count)
+        ]
+
+    def decaps(self, ciphertext, secret_key):
+        """Décapsulation: Récupère le secret partagé"""
+        secret_key = self._prepared_secret(secret_key)
+        if _is_bytes(ciphertext):
+            ciphertext = self.unpack_ciphertext(ciphertext)
+        if self.backend == "numpy":
+            c_u, c_v = ciphertext
+            return self._decaps_array(secret_key, [c_u], [c_v])[0]
+        return self._decaps(secret_key, ciphertext)
+
+    def _decaps(self, secret_key, ciphertext):
+        """Décapsulation (backend python) avec une clé secrète préparée"""
+        c_u, c_v = ciphertext
+        p = self.params
+        
+        #Décompression
+        u = PolyVec.decompress(c_u, p.du, p.decompress_tables[p.du])
+        v = Polynomial.decompress(c_v, p.dv, p.decompress_tables[p.dv])
+        
+        #Calcul pour retirer le masque : noisy_mu = v - s * u
+        #v - s*u ≈ (t*r + e2 + mu) - s*(A^T*r + e1)
+        # Comme t = As+e, les termes s'annulent approximativement, laissant mu + bruit
+        # s est déjà en NTT : NTT de u, produits point à point, une NTT inverse
+        noisy_mu = v - inner_ntt(secret_key.s_hat, vec_ntt(u))
+        
+        #Récupération du message (arrondi vers 0 ou Q/2)
+        mu_raw = decode_message(noisy_mu)
+        
+        #KDF pour retrouver le secret 
+        shared_secret = hashlib.sha3_256(mu_raw).digest()
+        
+        return shared_secret
+
+    def _decaps_array(self, secret_key, c_us, c_vs):
+        """Décapsulations (backend numpy) d'un lot de chiffrés empilés"""
+        np = _np
+        p = self.params
+        u = PolyArray.decompress(np.stack(c_us), p.du, p.array_tables["decompress", p.du])   # (B, K, N)
+        v = PolyArray.decompress(np.stack(c_vs), p.dv, p.array_tables["decompress", p.dv])   # (B, N)
+        noisy_mu = v - inner_ntt(secret_key.s_hat, ntt_array(u.data))
+        mus = _decode_messages_array(noisy_mu.data)
+        return [hashlib.sha3_256(m.tobytes()).digest() for m in mus]
+
+    # --- Lots ---
+    def encaps_many(self, public_key, count, workers=None):
+        """`count` encapsulations : liste de (ciphertext, shared_secret)"""
+        if workers and workers > 1 and count > 1:
+            packed = self.pack_public_key(self._prepared_public(public_key))
+            sizes = _shard_sizes(count, workers)
+            tasks = [(self.backend, self.params.name, packed, n) for n in sizes]
+            return _pool_run(_encaps_worker, workers, tasks)
+        public_key = self._prepared_public(public_key)
+        size = self.params.coins_size
+        coins = os.urandom(count * size)   # un seul tirage pour tout le lot
+        if self.backend == "numpy":
+            return self._encaps_array(public_key, coins) if count else []
+        return [self._encaps(public_key, coins[i : i + size]) for i in range(0, len(coins), size)]
+
+    def decaps_many(self, secret_key, ciphertexts, workers=None):
+        """Secrets partagés d'une suite de chiffrés (tuples ou bytes), dans l'ordre"""
+        ciphertexts = [
+            self.unpack_ciphertext(c) if _is_bytes(c) else c for c in ciphertexts
+        ]
+        if workers and workers > 1 and len(ciphertexts) > 1:
+            packed = self.pack_secret_key(self._prepared_secret(secret_key))
+            shards, start = [], 0
+            for n in _shard_sizes(len(ciphertexts), workers):
+                shards.append((self.backend, self.params.name, packed, ciphertexts[start : start + n]))
+                start += n
+            return _pool_run(_decaps_worker, workers, shards)
+        secret_key = self._prepared_secret(secret_key)
+        if self.backend == "numpy":
+            if not ciphertexts:
+                return []
+            c_us, c_vs = zip(*ciphertexts)
+            return self._decaps_array(secret_key, c_us, c_vs)
+        return [self._decaps(secret_key, c) for c in ciphertexts]
+
+
+def _shard_sizes(count, workers):
+    base, extra = divmod(count, workers)
+    return [base + (i < extra) for i in range(workers) if base + (i < extra)]
+
+
+def _encaps_worker(backend, params, packed_pk, count):
+    return KyberImplementation(backend, params).encaps_many(packed_pk, count)
+
+
+def _decaps_worker(backend, params, packed_sk, ciphertexts):
+    return KyberImplementation(backend, params).decaps_many(packed_sk, ciphertexts)
+
+
+def _keygen_worker(backend, params, count):
+    kyber = KyberImplementation(backend, params)
+    return [kyber.keygen() for _ in range(count)]
+
+
+def _pool_run(worker, workers, tasks):
+    """Exécute les tâches sur un pool de processus et concatène les résultats dans l'ordre"""
+    # Import à la demande : concurrent.futures est coûteux à importer
+    from concurrent.futures import ProcessPoolExecutor
+
+    out = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(worker, *zip(*tasks)):
+            out.extend(part)
+    return out
+
+
+# Attente avant de relancer un remplissage qui a échoué, doublée à chaque
+# échec consécutif (secondes)
+REFILL_RETRY_DELAY = 0.05
+REFILL_RETRY_MAX = 5.0
+
+
+class KeypairPool:
+    """Réserve de paires de clés générées en tâche de fond"""
+
+    def __init__(self, kyber=None, depth=16, workers=1, mode="thread", batch=4):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Mode de remplissage inconnu: {mode}")
+        if depth < 1 or workers < 1 or batch < 1:
+            raise ValueError("depth, workers et batch doivent être >= 1")
+        # Import à la demande : le module reste rapide à importer
+        import threading
+
+        self.kyber = kyber if kyber is not None else KyberImplementation()
+        self.depth = depth
+        self.batch = batch
+        self.mode = mode
+        self._keys = deque()
+        self._pending = 0   # paires en cours de génération
+        self._cond = threading.Condition()
+        self._closed = False
+        # Métriques
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.generated = 0
+        self.refill_time = 0.0
+        self.refill_max = 0.0
+        self.errors = 0
+        self.last_error = None   # dernier échec de remplissage (get() ne lève pas)
+        self._executor = None
+        if mode == "process":
+            # Import à la demande : concurrent.futures est coûteux à importer
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._threads = [
+            threading.Thread(target=self._refill_loop, name=f"kyber-keypool-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __len__(self):
+        with self._cond:
+            return len(self._keys)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self):
+        """Une paire (public_key, secret_key) : de la réserve, sinon générée tout de suite"""
+        with self._cond:
+            if self._closed:
+                raise ValueError("Réserve de clés fermée")
+            if self._keys:
+                self.hits += 1
+                pair = self._keys.popleft()
+            else:
+                self.misses += 1
+                pair = None
+            self._cond.notify_all()   # réveille le remplissage
+        return pair if pair is not None else self.kyber.keygen()
+
+    def wait_full(self, timeout=None):
+        """Attend que la réserve soit pleine (préchauffage) ; False si timeout"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._closed or len(self._keys) >= self.depth, timeout
+            )
+
+    def close(self):
+        """Arrête le remplissage et vide la réserve"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._keys.clear()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def stats(self):
+        with self._cond:
+            requests = self.hits + self.misses
+            return {
+                "depth": len(self._keys),
+                "target_depth": self.depth,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "refills": self.refills,
+                "generated": self.generated,
+                # Latence de génération en tâche de fond, par paire et pire lot
+                "refill_ms_per_key": 1000 * self.refill_time / self.generated if self.generated else 0.0,
+                "refill_ms_max": 1000 * self.refill_max,
+                "errors": self.errors,
+                "last_error": repr(self.last_error) if self.last_error is not None else None,
+            }
+
+    def _generate(self, count):
+        if self._executor is not None:
+            kyber = self.kyber
+            future = self._executor.submit(_keygen_worker, kyber.backend, kyber.params.name, count)
+            return future.result()
+        return [self.kyber.keygen() for _ in range(count)]
+
+    def _refill_loop(self):
+        failures = 0   # échecs consécutifs de ce remplisseur
+        while True:
+            with self._cond:
+                if failures:
+                    # Attente croissante avant de réessayer (exécuteur cassé, ...)
+                    delay = min(REFILL_RETRY_MAX, REFILL_RETRY_DELAY * 2 ** (failures - 1))
+                    self._cond.wait_for(lambda: self._closed, delay)
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._keys) + self._pending < self.depth
+                )
+                if self._closed:
+                    return
+                count = min(self.batch, self.depth - len(self._keys) - self._pending)
+                self._pending += count
+            start = time.perf_counter()
+            try:
+                pairs = self._generate(count)
+            except Exception as exc:
+                # get() continue de servir (keygen direct si la réserve est vide)
+                failures += 1
+                with self._cond:
+                    self._pending -= count
+                    self.errors += 1
+                    self.last_error = exc
+                continue
+            failures = 0
+            with self._cond:
+                self._pending -= count
+            elapsed = time.perf_counter() - start
+            with self._cond:
+                if self._closed:
+                    return
+                self._keys.extend(pairs)
+                self.refills += 1
+                self.generated += count
+                self.refill_time += elapsed
+                self.refill_max = max(self.refill_max, elapsed)
+                self._cond.notify_all()
+
+
+def check_ntt(trials=20):
+    """Compare la multiplication NTT à la multiplication naïve sur des polynômes aléatoires"""
+    for _ in range(trials):
+        a = Polynomial([random.randrange(Q) for _ in range(N)])
+        b = Polynomial([random.randrange(Q) for _ in range(N)])
+        if (a * b).coeffs != a.mul_naive(b).coeffs:
+            return False
+    # Cas limites : X^255 * X = -1, et aller-retour ntt / intt
+    x = [0] * N
+    x[N - 1] = 1
+    y = [0] * N
+    y[1] = 1
+    c = a.coeffs
+    return (Polynomial(x) * Polynomial(y)).coeffs == [Q - 1] + [0] * (N - 1) and intt(ntt(c)) == c
+
+
+def benchmark_mul(rounds=20):
+    """Temps moyen (ms) d'un produit : (naïf, NTT)"""
+    a = Polynomial([random.randrange(Q) for _ in range(N)])
+    b = Polynomial([random.randrange(Q) for _ in range(N)])
+    start = time.perf_counter()
+    for _ in range(rounds):
+        a.mul_naive(b)
+    naive = (time.perf_counter() - start) / rounds * 1000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        a * b
+    fast = (time.perf_counter() - start) / rounds * 1000
+    return naive, fast
+
+
+def benchmark_handshakes(backend="python", count=200, workers=None, params=KYBER512):
+    """Poignées de main (encaps + decaps) par seconde : (une par une, par lots)"""
+    kyber = KyberImplementation(backend, params)
+    pk, sk = kyber.keygen()
+    start = time.perf_counter()
+    for _ in range(count):
+        cipher, _ = kyber.encaps(pk)
+        kyber.decaps(cipher, sk)
+    single = count / (time.perf_counter() - start)
+    start = time.perf_counter()
+    results = kyber.encaps_many(pk, count, workers=workers)
+    kyber.decaps_many(sk, [cipher for cipher, _ in results], workers=workers)
+    batched = count / (time.perf_counter() - start)
+    return single, batched
+
+
+def benchmark_parameter_sets(backend="python", count=100):
+    """Par jeu : (nom, keygen / s, poignées de main / s par lots, taille clé publique, taille chiffré)"""
+    rows = []
+    for params in PARAMETER_SETS.values():
+        kyber = KyberImplementation(backend, params)
+        start = time.perf_counter()
+        for _ in range(20):
+            kyber.keygen()
+        keygens = 20 / (time.perf_counter() - start)
+        _, batched = benchmark_handshakes(backend, count, params=params)
+        rows.append((params.name, keygens, batched, params.public_key_size, params.ciphertext_size))
+    return rows
+
+def benchmark_keypair_pool(backend="python", count=100, depth=16, workers=1):
+    """Latence moyenne d'obtention d'une paire (ms) : (keygen direct, via KeypairPool), stats"""
+    kyber = KyberImplementation(backend)
+    pk, _ = kyber.keygen()
+    prepared = kyber.prepare_public_key(pk)
+
+    def run(acquire):
+        waited = 0.0
+        for _ in range(count):
+            start = time.perf_counter()
+            _, sk = acquire()
+            waited += time.perf_counter() - start
+            # Reste de la poignée de main (hors clé éphémère)
+            cipher, _ = kyber.encaps(prepared)
+            kyber.decaps(cipher, sk)
+        return 1000 * waited / count
+
+    direct = run(kyber.keygen)
+    with KeypairPool(kyber, depth=depth, workers=workers) as pool:
+        pool.wait_full()
+        pooled = run(pool.get)
+        stats = pool.stats()
+    return direct, pooled, stats
+
+def demo():
+    """Poignée de main complète avec affichage des deux secrets partagés"""
+    kyber = KyberImplementation()
+
+    pk, sk = kyber.keygen()
+
+    cipher, ss_alice = kyber.encaps(pk)
+
+    ss_bob = kyber.decaps(cipher, sk)
+
+    print("-" * 20)
+    print(f"{ss_alice.hex()[:16]}")
+    print(f"{ss_bob.hex()[:16]}")
+    print(f"{ss_alice == ss_bob}")
+
+
+if __name__ == "__main__":
+    demo()
+    print(f"NTT == naïf : {check_ntt()}")
+    naive_ms, ntt_ms = benchmark_mul()
+    print(f"mul naïve : {naive_ms:.2f} ms, mul NTT : {ntt_ms:.2f} ms (x{naive_ms / ntt_ms:.1f})")
+    for backend in ("python", "numpy"):
+        if backend == "numpy" and _numpy() is None:
+            continue
+        single, batched = benchmark_handshakes(backend)
+        print(f"{backend:6} : {single:.0f} poignées de main/s une par une, {batched:.0f}/s par lots")
+        for name, keygens, handshakes, pk_size, ct_size in benchmark_parameter_sets(backend):
+            print(
+                f"  {name:10} keygen {keygens:6.0f}/s  poignées de main {handshakes:6.0f}/s"
+                f"  clé publique {pk_size} o  chiffré {ct_size} o"
+            )
+        direct_ms, pooled_ms, stats = benchmark_keypair_pool(backend)
+        print(
+            f"  keygen direct {direct_ms:.2f} ms, via KeypairPool {pooled_ms:.2f} ms"
+            f" (hits {stats['hits']}, misses {stats['misses']})"
+        )
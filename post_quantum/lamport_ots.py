@@ -3,7 +3,7 @@ Implémentation simple d'un schéma de signature Lamport One-Time Signature (OTS
 C'est un schéma de signature post-quantique basé sur les fonctions de hachage.
 
 Utilisation comme module :
-    from lamport_ots import lamport_keygen, lamport_sign, lamport_verify
+    from post_quantum.lamport_ots import lamport_keygen, lamport_sign, lamport_verify
 
     sk, pk = lamport_keygen()
     sig = lamport_sign(sk, b"message")
@@ -54,8 +54,12 @@ def lamport_verify(pk, message, sig):
     return True
 
 
-if __name__ == "__main__":
+def demo():
     sk, pk = lamport_keygen()
     msg = b"flag{lamport_test}"
     sig = lamport_sign(sk, msg)
     print(lamport_verify(pk, msg, sig))
+
+
+if __name__ == "__main__":
+    demo()
@@ -7,7 +7,7 @@ Structure type :
 - decaps(sk, ct) -> K'
 
 Utilisation comme module :
-    from toy_lwe_kem import lwe_keygen, lwe_encaps, lwe_decaps
+    from post_quantum.lwe_kem import lwe_keygen, lwe_encaps, lwe_decaps
 
     pk, sk = lwe_keygen()
     ct, K  = lwe_encaps(pk)
@@ -71,8 +71,12 @@ def lwe_decaps(sk, ct):
     return K
 
 
-if __name__ == "__main__":
+def demo():
     pk, sk = lwe_keygen()
     ct, K1 = lwe_encaps(pk)
     K2 = lwe_decaps(sk, ct)
     print(K1 == K2)
+
+
+if __name__ == "__main__":
+    demo()
@@ -108,6 +108,9 @@ Utilisation rapide :
     sig = sp.sign(msg_hash)
     ok = sp.verify(msg_hash, sig, pk)
     print(ok)
+
+Démo (rien ne s'exécute à l'import) :
+    python -m post_quantum.sphincs
 """
 import hashlib
 import math
@@ -286,24 +289,29 @@ class SPHINCS_Simple:
         # Comparer la racine calculée avec la clé publique
         return curr == pub_root
 
-# Test
 
-sp = SPHINCS_Simple(height=3) # Petit arbre de 8 feuilles
-pk = sp.keygen()
-print(f"Clé Publique : {pk.hex()}")
+def demo():
+    """Signature et vérification sur un petit arbre de 8 feuilles"""
+    sp = SPHINCS_Simple(height=3) # Petit arbre de 8 feuilles
+    pk = sp.keygen()
+    print(f"Clé Publique : {pk.hex()}")
+
+    msg = b"Test"
+    # On hash le msg pour avoir la bonne taille
+    msg_hash = hash_f(msg)
+
+    signature = sp.sign(msg_hash)
+    print(f"Index utilisé : {signature['leaf_idx']}")
+    print(f"Taille signature WOTS : {len(signature['wots_sig'])} blocs")
+    print(f"Taille chemin Merkle  : {len(signature['auth_path'])} noeuds")
 
-msg = b"Test"
-# On hash le msg pour avoir la bonne taille
-msg_hash = hash_f(msg) 
+    is_valid = sp.verify(msg_hash, signature, pk)
 
-signature = sp.sign(msg_hash)
-print(f"Index utilisé : {signature['leaf_idx']}")
-print(f"Taille signature WOTS : {len(signature['wots_sig'])} blocs")
-print(f"Taille chemin Merkle  : {len(signature['auth_path'])} noeuds")
+    if is_valid:
+        print("Succes")
+    else:
+        print("Echec")
 
-is_valid = sp.verify(msg_hash, signature, pk)
 
-if is_valid:
-    print("Succes")
-else:
-    print("Echec")
\ No newline at end of file
+if __name__ == "__main__":
+    demo()